@@ -0,0 +1,351 @@
+"""
+Index build module for AI Research Assistant
+Builds indexes in resumable stages with periodic checkpoints, per-stage
+progress reporting and cooperative cancellation.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Optional, Tuple
+
+import numpy as np
+
+from app.config import (
+    CHUNK_SIZE,
+    CHUNK_OVERLAP,
+    CHECKPOINT_DIR,
+    CHECKPOINT_EVERY_FILES,
+    CHECKPOINT_EVERY_BATCHES,
+    BUILD_PROGRESS_INTERVAL,
+    EMBED_BATCH_SIZE,
+    DEFAULT_EMBEDDING_BACKEND
+)
+from app.chunk_store import ChunkStore
+from app.utils import (
+    DocumentLoader,
+    TextProcessor,
+    EmbeddingEngine,
+    VectorStoreManager,
+    default_index_name
+)
+
+logger = logging.getLogger(__name__)
+
+# Called with (stage, done, total, eta_seconds); eta is None until it can be estimated
+ProgressCallback = Callable[[str, int, int, Optional[float]], None]
+
+# Build stages in order: files loaded and chunked, chunks embedded, store written, index saved
+BUILD_STAGES = ("load", "embed", "index", "save")
+
+
+class BuildCancelled(Exception):
+    """Raised when a build stops because cancellation was requested."""
+
+
+class StageProgress:
+    """Throttled progress reporter for one build stage."""
+
+    def __init__(self, callback: Optional[ProgressCallback], stage: str, total: int, done: int = 0):
+        """
+        Initialize and report the starting position of a stage.
+
+        Args:
+            callback: Progress callback, or None to report nothing
+            stage: Stage name from BUILD_STAGES
+            total: Units of work in the stage
+            done: Units already completed (e.g. by a resumed build)
+        """
+        self.callback = callback
+        self.stage = stage
+        self.total = total
+        self._start_done = done
+        self._start_time = time.monotonic()
+        self._last_report = 0.0
+        self.update(done, force=True)
+
+    def update(self, done: int, force: bool = False) -> None:
+        """Report progress, at most once per BUILD_PROGRESS_INTERVAL unless finished or forced."""
+        if self.callback is None:
+            return
+        now = time.monotonic()
+        if not force and done < self.total and now - self._last_report < BUILD_PROGRESS_INTERVAL:
+            return
+        self._last_report = now
+
+        # ETA from the rate of this run only, so resumed work does not skew it
+        eta = None
+        progressed = done - self._start_done
+        if progressed > 0:
+            eta = (self.total - done) * (now - self._start_time) / progressed
+        self.callback(self.stage, done, self.total, eta)
+
+
+class IndexBuilder:
+    """
+    Resumable index build from a dataset directory.
+
+    Chunks of loaded files and embedding vectors are appended to a checkpoint
+    directory as they are produced, and a small state file records how much
+    of each is complete. Building the same dataset with the same model and
+    chunking again resumes from the last checkpoint, which is deleted once
+    the index is saved. Cancelling writes a checkpoint before stopping.
+    """
+
+    STATE_FILE = "state.json"
+    VECTORS_FILE = "vectors.f32"
+    CHUNKS_DIR = "chunks"
+
+    def __init__(
+        self,
+        data_directory: Path,
+        embedding_model: str,
+        vector_store_type: str,
+        embedding_backend: str = DEFAULT_EMBEDDING_BACKEND,
+        index_name: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+        cancel_event: Optional[threading.Event] = None,
+        checkpoint_root: Path = CHECKPOINT_DIR
+    ):
+        """
+        Initialize index builder.
+
+        Args:
+            data_directory: Path to directory with documents
+            embedding_model: Embedding model key
+            vector_store_type: Type of vector store
+            embedding_backend: Inference backend key from EMBEDDING_BACKENDS
+            index_name: Name of the index (defaults to dataset, model and backend)
+            progress: Called with (stage, done, total, eta_seconds) from the build thread
+            cancel_event: Event that stops the build at the next checkpoint when set
+            checkpoint_root: Directory holding build checkpoints
+        """
+        self.data_directory = Path(data_directory).resolve()
+        self.embedding_model = embedding_model
+        self.vector_store_type = vector_store_type
+        self.embedding_backend = embedding_backend
+        self.index_name = index_name or default_index_name(
+            self.data_directory, embedding_model, embedding_backend
+        )
+        self.progress = progress
+        self.cancel_event = cancel_event or threading.Event()
+
+        digest = hashlib.sha1(json.dumps(self._config(), sort_keys=True).encode('utf-8')).hexdigest()
+        self.checkpoint_dir = Path(checkpoint_root) / f"{self.index_name}-{digest[:16]}"
+
+    def _config(self) -> Dict:
+        """Settings a checkpoint must match to be resumed."""
+        return {
+            'data_directory': str(self.data_directory),
+            'embedding_model': self.embedding_model,
+            'embedding_backend': self.embedding_backend,
+            'chunk_size': CHUNK_SIZE,
+            'chunk_overlap': CHUNK_OVERLAP
+        }
+
+    @property
+    def has_checkpoint(self) -> bool:
+        """Whether a previous run of this build left a checkpoint."""
+        return (self.checkpoint_dir / self.STATE_FILE).exists()
+
+    def cancel(self) -> None:
+        """Request cancellation; the build stops at its next checkpoint."""
+        self.cancel_event.set()
+
+    def run(self) -> Tuple[VectorStoreManager, Dict]:
+        """
+        Build, save and return the index, resuming from a checkpoint if present.
+
+        Returns:
+            Tuple of (VectorStoreManager, statistics)
+
+        Raises:
+            BuildCancelled: If cancellation was requested; the checkpoint is kept
+        """
+        state = self._load_state()
+        self.checkpoint_dir.mkdir(parents=True, exist_ok=True)
+
+        chunk_store = ChunkStore()
+        if state['chunks']:
+            chunk_store = ChunkStore.load(self.checkpoint_dir / self.CHUNKS_DIR, limit=state['chunks'])
+
+        if state['stage'] == "load":
+            self._load_files(state, chunk_store)
+        if len(chunk_store) == 0:
+            shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+            raise ValueError("No documents loaded from directory")
+
+        embedding_engine = EmbeddingEngine(self.embedding_model, self.embedding_backend)
+        vectors = self._embed_chunks(state, chunk_store, embedding_engine)
+
+        vector_manager = VectorStoreManager(self.vector_store_type, embedding_engine)
+        tracker = StageProgress(self.progress, "index", len(chunk_store))
+
+        def index_progress(done: int, total: int) -> None:
+            # The vectors are already checkpointed, so stopping here loses nothing
+            if self.cancel_event.is_set():
+                raise BuildCancelled("Build cancelled while writing the index")
+            tracker.update(done)
+
+        vector_manager.create_vector_store_from_embeddings(
+            chunk_store, vectors, self.index_name, progress=index_progress
+        )
+        tracker.update(len(chunk_store), force=True)
+        del vectors
+
+        tracker = StageProgress(self.progress, "save", 1)
+        vector_manager.save_vector_store(self.index_name)
+        tracker.update(1)
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+        stats = DocumentLoader.scan_directory(self.data_directory)
+        stats['loaded_files'] = state['loaded_files']
+        stats['failed_files'] = state['failed_files']
+        stats['total_chunks'] = len(chunk_store)
+        return vector_manager, stats
+
+    # Checkpoints
+
+    def _load_state(self) -> Dict:
+        """Read the checkpoint state, discarding it if the dataset has changed."""
+        state_path = self.checkpoint_dir / self.STATE_FILE
+        if state_path.exists():
+            with open(state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('config') == self._config() and self._files_unchanged(state['files']):
+                logger.info(
+                    f"Resuming build of '{self.index_name}' at the {state['stage']} stage "
+                    f"({state['chunks']} chunks, {state['embedded']} embedded)"
+                )
+                return state
+            logger.warning(f"Dataset changed since the last checkpoint; rebuilding '{self.index_name}'")
+            shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+        return {
+            'config': self._config(),
+            'stage': "load",
+            'files': {},
+            'loaded_files': 0,
+            'failed_files': 0,
+            'chunks': 0,
+            'embedded': 0
+        }
+
+    @staticmethod
+    def _files_unchanged(files: Dict) -> bool:
+        """Check that already processed files still have the recorded size and mtime."""
+        for path, (size, mtime_ns) in files.items():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                return False
+            if stat.st_size != size or stat.st_mtime_ns != mtime_ns:
+                return False
+        return True
+
+    def _write_state(self, state: Dict) -> None:
+        """Atomically replace the checkpoint state file."""
+        staging = self.checkpoint_dir / (self.STATE_FILE + ".tmp")
+        with open(staging, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(staging, self.checkpoint_dir / self.STATE_FILE)
+
+    def _checkpoint(
+        self,
+        state: Dict,
+        chunk_store: ChunkStore,
+        vectors_file: Optional[BinaryIO] = None,
+        embedded: int = 0
+    ) -> None:
+        """Persist new chunks and vectors, then record them in the state file."""
+        if len(chunk_store) > state['chunks']:
+            chunk_store.save_from(self.checkpoint_dir / self.CHUNKS_DIR, state['chunks'])
+            state['chunks'] = len(chunk_store)
+        if vectors_file is not None:
+            vectors_file.flush()
+            os.fsync(vectors_file.fileno())
+            state['embedded'] = embedded
+        self._write_state(state)
+
+    def _raise_if_cancelled(self, *checkpoint_args) -> None:
+        """Checkpoint and stop if cancellation was requested."""
+        if self.cancel_event.is_set():
+            self._checkpoint(*checkpoint_args)
+            logger.info(f"Build of '{self.index_name}' cancelled; checkpoint kept for resuming")
+            raise BuildCancelled("Build cancelled; progress was saved and the next build resumes it")
+
+    # Stages
+
+    def _load_files(self, state: Dict, chunk_store: ChunkStore) -> None:
+        """Load and chunk every file not yet recorded in the checkpoint."""
+        splitter = TextProcessor().text_splitter
+        files = sorted(DocumentLoader.iter_supported_files(self.data_directory))
+        processed = state['files']
+        pending = [file_path for file_path in files if str(file_path) not in processed]
+
+        done = len(files) - len(pending)
+        tracker = StageProgress(self.progress, "load", len(files), done)
+        for file_path in pending:
+            self._raise_if_cancelled(state, chunk_store)
+
+            doc = DocumentLoader.load_document(file_path)
+            if doc:
+                chunk_store.add_documents(splitter.split_documents([doc]))
+                state['loaded_files'] += 1
+            else:
+                state['failed_files'] += 1
+
+            stat = file_path.stat()
+            processed[str(file_path)] = [stat.st_size, stat.st_mtime_ns]
+            done += 1
+            if done % CHECKPOINT_EVERY_FILES == 0:
+                self._checkpoint(state, chunk_store)
+            tracker.update(done)
+
+        state['stage'] = "embed"
+        self._checkpoint(state, chunk_store)
+        logger.info(f"Loaded {state['loaded_files']}/{len(files)} documents into {len(chunk_store)} chunks")
+
+    def _embed_chunks(self, state: Dict, chunk_store: ChunkStore, embedding_engine: EmbeddingEngine) -> np.ndarray:
+        """Embed chunks not yet in the checkpoint and return all vectors memory-mapped."""
+        total = len(chunk_store)
+        dimension = embedding_engine.dimension
+        path = self.checkpoint_dir / self.VECTORS_FILE
+        row_bytes = dimension * np.dtype(np.float32).itemsize
+
+        if state['stage'] == "embed":
+            open(path, 'ab').close()
+            with open(path, 'r+b') as vectors_file:
+                # Drop vectors written after the last checkpoint
+                embedded = state['embedded']
+                vectors_file.truncate(embedded * row_bytes)
+                vectors_file.seek(0, os.SEEK_END)
+
+                tracker = StageProgress(self.progress, "embed", total, embedded)
+                batches = 0
+                while embedded < total:
+                    self._raise_if_cancelled(state, chunk_store, vectors_file, embedded)
+
+                    texts = [
+                        chunk_store.get_text(chunk_id)
+                        for chunk_id in range(embedded, min(embedded + EMBED_BATCH_SIZE, total))
+                    ]
+                    vectors_file.write(embedding_engine.embed_documents_array(texts).tobytes())
+                    embedded += len(texts)
+
+                    batches += 1
+                    if batches % CHECKPOINT_EVERY_BATCHES == 0:
+                        self._checkpoint(state, chunk_store, vectors_file, embedded)
+                    tracker.update(embedded)
+
+                state['stage'] = "index"
+                self._checkpoint(state, chunk_store, vectors_file, embedded)
+
+        return np.memmap(path, dtype=np.float32, mode='r', shape=(total, dimension))
@@ -0,0 +1,300 @@
+"""
+Index catalog module for AI Research Assistant
+Lists saved indexes, loads them lazily on first use and keeps the loaded set
+within a memory budget.
+"""
+
+import json
+import logging
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from app.config import (
+    VECTOR_STORE_DIR,
+    VECTOR_STORES,
+    DEFAULT_EMBEDDING_BACKEND,
+    INDEX_MEMORY_BUDGET_MB
+)
+from app.utils import EmbeddingEngine, VectorStoreManager
+
+logger = logging.getLogger(__name__)
+
+# Directory suffix -> store type, e.g. "faiss" -> "FAISS"
+STORE_SUFFIXES = {store_type.lower(): store_type for store_type in VECTOR_STORES}
+
+
+def _directory_size(path: Path) -> int:
+    """Total size in bytes of all files under a directory."""
+    return sum(f.stat().st_size for f in path.rglob('*') if f.is_file())
+
+
+class IndexCatalog:
+    """
+    Catalog of the indexes saved under VECTOR_STORE_DIR.
+
+    Indexes are loaded on first use and evicted least-recently-used when the
+    estimated memory of loaded indexes exceeds the budget; evicted managers
+    are closed, so they must not be used afterwards. Indexes built with
+    the same embedding model and backend share one EmbeddingEngine.
+    """
+
+    def __init__(
+        self,
+        root: Path = VECTOR_STORE_DIR,
+        memory_budget_mb: int = INDEX_MEMORY_BUDGET_MB,
+        embedding_backend: str = DEFAULT_EMBEDDING_BACKEND
+    ):
+        """
+        Initialize index catalog.
+
+        Args:
+            root: Directory containing saved indexes
+            memory_budget_mb: Memory budget for loaded indexes in megabytes
+            embedding_backend: Inference backend for engines the catalog creates
+        """
+        self.root = Path(root)
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self.embedding_backend = embedding_backend
+
+        self._loaded: "OrderedDict[Tuple[str, str], VectorStoreManager]" = OrderedDict()
+        self._disk_bytes: Dict[Tuple[str, str], int] = {}
+        self._engines: Dict[Tuple[str, str], EmbeddingEngine] = {}
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def list_indexes(self) -> List[Dict]:
+        """
+        List all saved indexes.
+
+        Returns:
+            One dictionary per index with name, store_type, model_key,
+            dimension, chunk_count, size_bytes, version and loaded flag.
+            Model details are None for indexes saved without a manifest.
+        """
+        indexes = []
+        if not self.root.exists():
+            return indexes
+
+        for directory in sorted(self.root.iterdir()):
+            name, _, suffix = directory.name.rpartition('_')
+            if not directory.is_dir() or not name or suffix not in STORE_SUFFIXES:
+                continue
+            indexes.append(self._describe(name, STORE_SUFFIXES[suffix], directory))
+        return indexes
+
+    def _describe(self, name: str, store_type: str, directory: Path) -> Dict:
+        """Build the catalog entry for one saved index."""
+        info = {
+            'name': name,
+            'store_type': store_type,
+            'model_key': None,
+            'dimension': None,
+            'chunk_count': None,
+            'size_bytes': 0,
+            'version': None,
+            'loaded': (name, store_type) in self._loaded
+        }
+
+        pointer = directory / VectorStoreManager.CURRENT_FILE
+        snapshot = directory
+        if pointer.exists():
+            info['version'] = pointer.read_text(encoding='utf-8').strip()
+            snapshot = directory / "versions" / info['version']
+
+        manifest_path = snapshot / VectorStoreManager.MANIFEST_FILE
+        if manifest_path.exists():
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+            for field in ('model_key', 'dimension', 'chunk_count'):
+                info[field] = manifest.get(field)
+
+        if snapshot.exists():
+            info['size_bytes'] = _directory_size(snapshot)
+        return info
+
+    def _engine(self, model_key: str) -> EmbeddingEngine:
+        """Return the shared engine for a model on the catalog's backend, creating it if needed."""
+        engine_key = (model_key, self.embedding_backend)
+        with self._lock:
+            engine = self._engines.get(engine_key)
+        if engine is None:
+            engine = EmbeddingEngine(model_key, self.embedding_backend)
+            with self._lock:
+                engine = self._engines.setdefault(engine_key, engine)
+        return engine
+
+    def get(self, name: str, store_type: str) -> VectorStoreManager:
+        """
+        Return a loaded index, loading it on first use.
+
+        Args:
+            name: Index name
+            store_type: Type of vector store ('FAISS' or 'ChromaDB')
+
+        Returns:
+            VectorStoreManager serving the index
+        """
+        key = (name, store_type)
+        with self._lock:
+            manager = self._loaded.get(key)
+            if manager is not None:
+                self._loaded.move_to_end(key)
+                return manager
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+
+        # Loads of different indexes proceed in parallel; the same index loads once
+        with load_lock:
+            with self._lock:
+                manager = self._loaded.get(key)
+                if manager is not None:
+                    self._loaded.move_to_end(key)
+                    return manager
+
+            directory = self.root / f"{name}_{store_type.lower()}"
+            info = self._describe(name, store_type, directory)
+            if info['model_key'] is None:
+                raise ValueError(f"Index '{name}' ({store_type}) has no manifest naming its embedding model")
+
+            manager = VectorStoreManager(store_type, self._engine(info['model_key']))
+            if not manager.load_vector_store(name):
+                raise ValueError(f"Failed to load index '{name}' ({store_type})")
+
+            self._add(key, manager, info['size_bytes'])
+        return manager
+
+    def add(self, manager: VectorStoreManager) -> None:
+        """
+        Register an index that was built in this process.
+
+        Args:
+            manager: Manager holding a named index
+        """
+        if manager.index_name is None:
+            raise ValueError("Only named indexes can be added to the catalog")
+
+        # ChromaDB memory is estimated from disk: the saved snapshot, or the
+        # build directory of an index that has not been saved yet
+        directory = self.root / f"{manager.index_name}_{manager.store_type.lower()}"
+        snapshot = directory / "versions" / manager.version if manager.version else directory / "build"
+        disk_bytes = _directory_size(snapshot) if snapshot.exists() else 0
+
+        self._add((manager.index_name, manager.store_type), manager, disk_bytes)
+
+    def _add(self, key: Tuple[str, str], manager: VectorStoreManager, disk_bytes: int) -> None:
+        """Track a loaded index and evict others to stay within budget."""
+        with self._lock:
+            self._loaded[key] = manager
+            self._loaded.move_to_end(key)
+            self._disk_bytes[key] = disk_bytes
+            engine = manager.embedding_engine
+            self._engines.setdefault((engine.model_key, engine.backend), engine)
+            evicted = self._evict(keep=key)
+        for evicted_manager in evicted:
+            evicted_manager.close()
+
+        size = self.estimate_memory(manager, disk_bytes)
+        logger.info(f"Index '{key[0]}' ({key[1]}) loaded, ~{size / 1024 / 1024:.1f} MB")
+
+    @staticmethod
+    def estimate_memory(manager: VectorStoreManager, disk_bytes: int = 0) -> int:
+        """
+        Estimate resident memory of a loaded index.
+
+        FAISS indexes are measured from their vectors, chunk store, document
+        index and (once built) lexical index; ChromaDB indexes fall back to
+        their on-disk size.
+        """
+        if manager.store_type == "FAISS" and manager.vector_store is not None:
+            index = manager.vector_store
+            size = index.ntotal * index.d * 4 + manager.chunk_store.nbytes
+            for derived in (manager.build_document_index(), manager.lexical_index):
+                if derived is not None:
+                    size += derived.nbytes
+            return size
+        return disk_bytes
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated memory of all loaded indexes."""
+        with self._lock:
+            return sum(self._sizes().values())
+
+    def _sizes(self) -> Dict[Tuple[str, str], int]:
+        """
+        Estimate each loaded index's memory.
+
+        Re-estimated on every check, since lexical indexes are built in the
+        background after an index is added.
+        """
+        return {
+            key: self.estimate_memory(manager, self._disk_bytes[key])
+            for key, manager in self._loaded.items()
+        }
+
+    def _evict(self, keep: Tuple[str, str]) -> List[VectorStoreManager]:
+        """
+        Drop least recently used indexes until the loaded set fits the budget.
+
+        Returns:
+            Evicted managers, to be closed once the catalog lock is released
+        """
+        evicted = []
+        sizes = self._sizes()
+        while len(self._loaded) > 1 and sum(sizes.values()) > self.memory_budget_bytes:
+            oldest = next(key for key in self._loaded if key != keep)
+            evicted.append(self._loaded.pop(oldest))
+            del sizes[oldest]
+            del self._disk_bytes[oldest]
+            logger.info(f"Evicted index '{oldest[0]}' ({oldest[1]}) from memory")
+        self._release_engines()
+        return evicted
+
+    def _release_engines(self) -> None:
+        """Drop engines that no loaded index uses any more."""
+        in_use = {
+            (manager.embedding_engine.model_key, manager.embedding_engine.backend)
+            for manager in self._loaded.values()
+        }
+        for engine_key in list(self._engines):
+            if engine_key not in in_use:
+                del self._engines[engine_key]
+
+    def evict(self, name: str, store_type: str) -> bool:
+        """
+        Unload an index and release its memory.
+
+        Returns:
+            True if the index was loaded
+        """
+        key = (name, store_type)
+        with self._lock:
+            manager = self._loaded.pop(key, None)
+            if manager is None:
+                return False
+            del self._disk_bytes[key]
+            self._release_engines()
+        manager.close()
+        return True
+
+    def loaded(self) -> List[Tuple[str, str]]:
+        """List loaded (name, store_type) pairs, least recently used first."""
+        with self._lock:
+            return list(self._loaded)
+
+    def search(self, name: str, store_type: str, query: str, k: int = 5, **kwargs):
+        """
+        Search an index, loading it if necessary.
+
+        Args:
+            name: Index name
+            store_type: Type of vector store
+            query: Search query
+            k: Number of top results to return
+            **kwargs: Passed to VectorStoreManager.similarity_search
+
+        Returns:
+            List of (Document, score) tuples
+        """
+        return self.get(name, store_type).similarity_search(query, k=k, **kwargs)
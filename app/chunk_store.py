@@ -0,0 +1,271 @@
+"""
+Compact chunk storage for AI Research Assistant
+Keeps all chunk text in one contiguous buffer and interns per-file metadata,
+so large indexes do not pay Python object overhead for every chunk.
+"""
+
+import itertools
+import json
+import os
+import sys
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from langchain_core.documents import Document
+
+# Process-unique ids, so results from different stores never share cache keys
+_store_ids = itertools.count()
+
+
+class ChunkResult:
+    """
+    Lightweight view of a single stored chunk.
+
+    Exposes the same `page_content` and `metadata` attributes as a LangChain
+    Document, but only reads them from the owning ChunkStore on access.
+    """
+
+    __slots__ = ("chunk_id", "_store")
+
+    def __init__(self, store: "ChunkStore", chunk_id: int):
+        self._store = store
+        self.chunk_id = chunk_id
+
+    @property
+    def page_content(self) -> str:
+        """Full text of the chunk."""
+        return self._store.get_text(self.chunk_id)
+
+    @property
+    def metadata(self) -> Dict:
+        """Metadata of the file the chunk belongs to."""
+        return self._store.get_metadata(self.chunk_id)
+
+    @property
+    def cache_key(self) -> Tuple[int, int]:
+        """Key identifying this chunk across all stores in the process."""
+        return (self._store.uid, self.chunk_id)
+
+    def preview(self, max_chars: int) -> Tuple[str, bool]:
+        """Return the start of the chunk text and whether it was truncated."""
+        return self._store.get_preview(self.chunk_id, max_chars)
+
+    def __repr__(self) -> str:
+        return f"ChunkResult(chunk_id={self.chunk_id})"
+
+
+class ChunkStore:
+    """
+    Append-only store of text chunks.
+
+    Chunk text is kept as UTF-8 in a single buffer addressed by an offsets
+    array, and each chunk references an interned metadata entry (one per
+    source file) by integer id.
+    """
+
+    TEXT_FILE = "chunks.bin"
+    OFFSETS_FILE = "offsets.bin"
+    FILE_IDS_FILE = "file_ids.bin"
+    METADATA_FILE = "chunks.json"
+
+    def __init__(self):
+        """Initialize an empty chunk store."""
+        self.uid = next(_store_ids)
+        self._buffer = bytearray()
+        self._offsets = array('q', [0])
+        self._file_ids = array('i')
+        self._files: List[Dict] = []
+        self._file_index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._file_ids)
+
+    @property
+    def num_files(self) -> int:
+        """Number of distinct metadata entries (source files)."""
+        return len(self._files)
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by text, offsets and file ids."""
+        return (
+            len(self._buffer)
+            + self._offsets.itemsize * len(self._offsets)
+            + self._file_ids.itemsize * len(self._file_ids)
+        )
+
+    def _intern_metadata(self, metadata: Dict) -> int:
+        """Return the id of an identical metadata entry, adding it if new."""
+        key = json.dumps(metadata, sort_keys=True, default=str)
+        file_id = self._file_index.get(key)
+        if file_id is None:
+            file_id = len(self._files)
+            self._files.append(dict(metadata))
+            self._file_index[key] = file_id
+        return file_id
+
+    def add(self, text: str, metadata: Dict) -> int:
+        """
+        Append a chunk to the store.
+
+        Args:
+            text: Chunk text
+            metadata: Chunk metadata (interned per distinct value)
+
+        Returns:
+            Integer id of the new chunk
+        """
+        self._buffer += text.encode('utf-8')
+        self._offsets.append(len(self._buffer))
+        self._file_ids.append(self._intern_metadata(metadata))
+        return len(self._file_ids) - 1
+
+    def add_documents(self, documents: List[Document]) -> None:
+        """Append LangChain Document chunks in order."""
+        for doc in documents:
+            self.add(doc.page_content, doc.metadata)
+
+    @classmethod
+    def from_documents(cls, documents: List[Document]) -> "ChunkStore":
+        """Create a chunk store from LangChain Document chunks."""
+        store = cls()
+        store.add_documents(documents)
+        return store
+
+    def get_text(self, chunk_id: int) -> str:
+        """Return the full text of a chunk."""
+        start, end = self._offsets[chunk_id], self._offsets[chunk_id + 1]
+        return self._buffer[start:end].decode('utf-8')
+
+    def get_preview(self, chunk_id: int, max_chars: int) -> Tuple[str, bool]:
+        """
+        Return the first characters of a chunk without decoding all of it.
+
+        Args:
+            chunk_id: Chunk to preview
+            max_chars: Maximum number of characters to return
+
+        Returns:
+            Tuple of (preview text, whether the chunk is longer than the preview)
+        """
+        start, end = self._offsets[chunk_id], self._offsets[chunk_id + 1]
+        # A UTF-8 character takes at most 4 bytes
+        stop = min(end, start + 4 * max_chars)
+        text = self._buffer[start:stop].decode('utf-8', errors='ignore')
+        return text[:max_chars], len(text) > max_chars or stop < end
+
+    def get_metadata(self, chunk_id: int) -> Dict:
+        """Return a copy of the metadata of a chunk."""
+        return dict(self._files[self._file_ids[chunk_id]])
+
+    def file_id(self, chunk_id: int) -> int:
+        """Return the metadata entry id referenced by a chunk."""
+        return self._file_ids[chunk_id]
+
+    def file_ids(self) -> array:
+        """Return the metadata entry id of every chunk, in chunk order (do not modify)."""
+        return self._file_ids
+
+    def result(self, chunk_id: int) -> ChunkResult:
+        """Materialize a result view for a chunk."""
+        return ChunkResult(self, chunk_id)
+
+    def save(self, directory: Path) -> None:
+        """
+        Save the chunk store to a directory.
+
+        Args:
+            directory: Target directory (created if missing)
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        with open(directory / self.TEXT_FILE, 'wb') as f:
+            f.write(self._buffer)
+        with open(directory / self.OFFSETS_FILE, 'wb') as f:
+            self._offsets.tofile(f)
+        with open(directory / self.FILE_IDS_FILE, 'wb') as f:
+            self._file_ids.tofile(f)
+        self._save_metadata(directory)
+
+    def _save_metadata(self, directory: Path) -> None:
+        """Atomically write the metadata file."""
+        staging = directory / (self.METADATA_FILE + ".tmp")
+        with open(staging, 'w', encoding='utf-8') as f:
+            json.dump({"byteorder": sys.byteorder, "files": self._files}, f)
+        os.replace(staging, directory / self.METADATA_FILE)
+
+    def save_from(self, directory: Path, start: int) -> None:
+        """
+        Append chunks to a store saved earlier, without rewriting old chunks.
+
+        The directory must hold at least this store's first `start` chunks;
+        anything saved beyond them (e.g. by an interrupted write) is replaced.
+
+        Args:
+            directory: Directory written by `save` or `save_from`
+            start: Number of chunks already saved
+        """
+        directory = Path(directory)
+        if start == 0 or not self.exists(directory):
+            self.save(directory)
+            return
+
+        text_start = self._offsets[start]
+        with open(directory / self.TEXT_FILE, 'r+b') as f:
+            f.truncate(text_start)
+            f.seek(text_start)
+            f.write(self._buffer[text_start:])
+        with open(directory / self.OFFSETS_FILE, 'r+b') as f:
+            f.truncate((start + 1) * self._offsets.itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(self._offsets[start + 1:].tobytes())
+        with open(directory / self.FILE_IDS_FILE, 'r+b') as f:
+            f.truncate(start * self._file_ids.itemsize)
+            f.seek(0, os.SEEK_END)
+            f.write(self._file_ids[start:].tobytes())
+        self._save_metadata(directory)
+
+    @classmethod
+    def load(cls, directory: Path, limit: Optional[int] = None) -> "ChunkStore":
+        """
+        Load a chunk store saved with `save`.
+
+        Args:
+            directory: Directory containing the saved store
+            limit: Load only the first `limit` chunks
+
+        Returns:
+            Loaded ChunkStore
+        """
+        directory = Path(directory)
+        store = cls()
+
+        with open(directory / cls.METADATA_FILE, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+
+        store._offsets = array('q')
+        store._file_ids = array('i')
+        offsets = (directory / cls.OFFSETS_FILE).read_bytes()
+        file_ids = (directory / cls.FILE_IDS_FILE).read_bytes()
+        if limit is not None:
+            offsets = offsets[:(limit + 1) * store._offsets.itemsize]
+            file_ids = file_ids[:limit * store._file_ids.itemsize]
+        store._offsets.frombytes(offsets)
+        store._file_ids.frombytes(file_ids)
+        if info.get("byteorder", sys.byteorder) != sys.byteorder:
+            store._offsets.byteswap()
+            store._file_ids.byteswap()
+
+        with open(directory / cls.TEXT_FILE, 'rb') as f:
+            store._buffer = bytearray(f.read(store._offsets[-1]))
+
+        for metadata in info["files"]:
+            store._intern_metadata(metadata)
+        return store
+
+    @classmethod
+    def exists(cls, directory: Path) -> bool:
+        """Check whether a saved chunk store is present in a directory."""
+        return (Path(directory) / cls.METADATA_FILE).exists()
@@ -0,0 +1,203 @@
+"""
+Columnar export module for AI Research Assistant
+Writes chunk text, metadata and embedding vectors to Arrow IPC or Parquet
+files and reads them back, so embeddings computed once can populate any
+store type on any machine.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from app.chunk_store import ChunkStore
+
+logger = logging.getLogger(__name__)
+
+# Suffixes written as Parquet; anything else is written as an Arrow IPC file
+PARQUET_SUFFIXES = {".parquet", ".pq"}
+
+# Rows per Parquet row group when exporting
+EXPORT_BATCH_SIZE = 10000
+
+FORMAT_VERSION = "1"
+
+
+def _pyarrow():
+    """Import pyarrow, which is only needed for columnar export and import."""
+    try:
+        import pyarrow
+        import pyarrow.ipc
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Arrow/Parquet export requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def _schema(pa, model_key: str, dimension: int):
+    """Schema of an embeddings file; the model is recorded in the schema metadata."""
+    return pa.schema(
+        [
+            pa.field("chunk_id", pa.int64()),
+            pa.field("text", pa.large_string()),
+            pa.field("source", pa.string()),
+            pa.field("metadata", pa.string()),
+            pa.field("vector", pa.list_(pa.float32(), dimension))
+        ],
+        metadata={
+            "format_version": FORMAT_VERSION,
+            "model_key": model_key,
+            "dimension": str(dimension)
+        }
+    )
+
+
+def write_embeddings(
+    path: Path,
+    batches: Iterable[Tuple[List[str], List[Dict], np.ndarray]],
+    model_key: str,
+    dimension: int
+) -> int:
+    """
+    Write chunks and their vectors to an Arrow IPC or Parquet file.
+
+    Parquet files get one row group per batch and are streamed to disk. Arrow
+    IPC files are written as a single record batch, so readers can memory-map
+    the vector column as one contiguous array; this holds every row in memory
+    until the end, briefly twice while the batches are joined, so export
+    large indexes to Parquet.
+
+    Args:
+        path: Output file; .parquet/.pq writes Parquet, other suffixes Arrow IPC
+        batches: (texts, metadatas, vectors) batches in chunk order
+        model_key: Embedding model that produced the vectors
+        dimension: Vector dimension
+
+    Returns:
+        Number of rows written
+    """
+    pa = _pyarrow()
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    schema = _schema(pa, model_key, dimension)
+
+    if path.suffix.lower() in PARQUET_SUFFIXES:
+        writer = pa.parquet.ParquetWriter(str(path), schema)
+    else:
+        writer = pa.ipc.new_file(str(path), schema)
+
+    rows = 0
+    pending = []
+    try:
+        for texts, metadatas, vectors in batches:
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            batch = pa.record_batch(
+                [
+                    pa.array(np.arange(rows, rows + len(texts), dtype=np.int64)),
+                    pa.array(texts, type=pa.large_string()),
+                    pa.array([str(metadata.get('source', '')) for metadata in metadatas], type=pa.string()),
+                    pa.array([json.dumps(metadata, default=str) for metadata in metadatas], type=pa.string()),
+                    pa.FixedSizeListArray.from_arrays(pa.array(vectors.reshape(-1)), dimension)
+                ],
+                schema=schema
+            )
+            if isinstance(writer, pa.parquet.ParquetWriter):
+                writer.write_batch(batch)
+            else:
+                pending.append(batch)
+            rows += len(texts)
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending, schema).combine_chunks())
+    finally:
+        writer.close()
+
+    logger.info(f"Exported {rows} chunks to {path}")
+    return rows
+
+
+def _export_metadata(schema, path: Path) -> Tuple[str, int]:
+    """Return (model_key, dimension) recorded in an embeddings file schema."""
+    metadata = {key.decode('utf-8'): value.decode('utf-8') for key, value in (schema.metadata or {}).items()}
+    if "model_key" not in metadata:
+        raise ValueError(f"{path} is not an embeddings export (no model_key in schema)")
+    return metadata["model_key"], int(metadata["dimension"])
+
+
+def read_export_info(path: Path) -> Dict:
+    """
+    Read the model, dimension and row count of an embeddings file without loading it.
+
+    Args:
+        path: Arrow IPC or Parquet file written by `write_embeddings`
+
+    Returns:
+        Dictionary with model_key, dimension and rows
+    """
+    pa = _pyarrow()
+    path = Path(path)
+    if path.suffix.lower() in PARQUET_SUFFIXES:
+        parquet_file = pa.parquet.ParquetFile(str(path))
+        schema, rows = parquet_file.schema_arrow, parquet_file.metadata.num_rows
+    else:
+        reader = pa.ipc.open_file(pa.memory_map(str(path), 'r'))
+        schema = reader.schema
+        rows = sum(reader.get_batch(i).num_rows for i in range(reader.num_record_batches))
+
+    model_key, dimension = _export_metadata(schema, path)
+    return {'model_key': model_key, 'dimension': dimension, 'rows': rows}
+
+
+class EmbeddingFile:
+    """
+    Chunks and vectors read from a file written by `write_embeddings`.
+
+    Arrow IPC files are memory-mapped; when the file holds one record batch
+    (as export_embeddings writes them) the vector column is viewed in place
+    without reading it into memory. Parquet files, and IPC files with several
+    batches, are decoded or joined once into Arrow memory, which NumPy then
+    views without a further copy.
+    """
+
+    def __init__(self, path: Path):
+        """
+        Open an embeddings file.
+
+        Args:
+            path: Arrow IPC or Parquet file written by `write_embeddings`
+        """
+        pa = _pyarrow()
+        self.path = Path(path)
+
+        if self.path.suffix.lower() in PARQUET_SUFFIXES:
+            self.table = pa.parquet.read_table(str(self.path), memory_map=True)
+        else:
+            self.table = pa.ipc.open_file(pa.memory_map(str(self.path), 'r')).read_all()
+
+        self.model_key, self.dimension = _export_metadata(self.table.schema, self.path)
+        self._vectors: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """Read-only float32 array of shape (rows, dimension)."""
+        if self._vectors is None:
+            column = self.table.column("vector")
+            # Several record batches or row groups have to be joined once
+            chunk = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+            values = chunk.flatten().to_numpy(zero_copy_only=True)
+            self._vectors = values.reshape(len(self), self.dimension)
+        return self._vectors
+
+    def chunk_store(self) -> ChunkStore:
+        """Copy chunk text and metadata into a ChunkStore, in chunk order."""
+        store = ChunkStore()
+        for batch in self.table.select(["text", "metadata"]).to_batches(max_chunksize=EXPORT_BATCH_SIZE):
+            texts = batch.column(0).to_pylist()
+            metadatas = batch.column(1).to_pylist()
+            for text, metadata in zip(texts, metadatas):
+                store.add(text, json.loads(metadata) if metadata else {})
+        return store
@@ -14,6 +14,8 @@ DATA_DIR = PROJECT_ROOT / "data"
 EMBEDDINGS_DIR = PROJECT_ROOT / "embeddings"
 VECTOR_STORE_DIR = PROJECT_ROOT / "Vector_Store"
 EXPERIMENTS_DIR = PROJECT_ROOT / "experiments"
+CHECKPOINT_DIR = VECTOR_STORE_DIR / ".checkpoints"  # Partial index builds, created on demand
+EXPORT_DIR = VECTOR_STORE_DIR / "exports"  # Arrow/Parquet embedding exports, created on demand
 
 # Create directories if they don't exist
 for dir_path in [DATA_DIR, EMBEDDINGS_DIR, VECTOR_STORE_DIR, EXPERIMENTS_DIR]:
@@ -25,43 +27,89 @@ EMBEDDING_MODELS = {
     "all-MiniLM-L6-v2": {
         "name": "sentence-transformers/all-MiniLM-L6-v2",
         "dimension": 384,
-        "description": "Fast and efficient, good for general use"
+        "description": "Fast and efficient, good for general use",
+        "size_mb": 90
     },
     "all-mpnet-base-v2": {
         "name": "sentence-transformers/all-mpnet-base-v2",
         "dimension": 768,
-        "description": "High quality, balanced speed/performance"
+        "description": "High quality, balanced speed/performance",
+        "size_mb": 420
     },
     "multi-qa-MiniLM-L6-cos-v1": {
         "name": "sentence-transformers/multi-qa-MiniLM-L6-cos-v1",
         "dimension": 384,
-        "description": "Optimized for question-answering"
+        "description": "Optimized for question-answering",
+        "size_mb": 90
     },
     "paraphrase-multilingual-MiniLM-L12-v2": {
         "name": "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
         "dimension": 384,
-        "description": "Supports 50+ languages"
+        "description": "Supports 50+ languages",
+        "size_mb": 470
     },
     "all-distilroberta-v1": {
         "name": "sentence-transformers/all-distilroberta-v1",
         "dimension": 768,
-        "description": "High quality RoBERTa-based model"
+        "description": "High quality RoBERTa-based model",
+        "size_mb": 330
     }
 }
 
+# Embedding inference backends (CPU)
+EMBEDDING_BACKENDS = {
+    "torch": "PyTorch (reference)",
+    "int8": "PyTorch with dynamic int8 quantization",
+    "onnx": "ONNX Runtime (requires optimum[onnxruntime])",
+    "onnx-int8": "ONNX Runtime with dynamic int8 quantization"
+}
+DEFAULT_EMBEDDING_BACKEND = "torch"
+MODEL_POOL_MEMORY_MB = 2048  # Memory budget for warm models kept in the pool
+EMBEDDING_PARITY_THRESHOLD = 0.98  # Min cosine vs PyTorch for optimized backends
+
 # Vector Store Options
 VECTOR_STORES = {
     "FAISS": "Facebook AI Similarity Search - Fast in-memory search",
     "ChromaDB": "Chroma - Open-source embedding database"
 }
 
+DEFAULT_INDEX_NAME = "default"  # Index name used when none is given
+CHROMA_BATCH_SIZE = 1000  # Chunks embedded and upserted per ChromaDB write
+INDEX_VERSIONS_KEPT = 3  # Saved snapshots kept per index
+INDEX_MEMORY_BUDGET_MB = 4096  # Memory budget for indexes kept loaded by the catalog
+
 # Text Processing Settings
 CHUNK_SIZE = 1000  # Characters per chunk
 CHUNK_OVERLAP = 200  # Overlap between chunks
 
+# Embedding Settings
+EMBED_BATCH_SIZE = 256  # Chunks embedded per model call during index builds
+
+# Index Build Settings
+CHECKPOINT_EVERY_FILES = 200  # Files loaded between build checkpoints
+CHECKPOINT_EVERY_BATCHES = 20  # Embedding batches between build checkpoints
+BUILD_PROGRESS_INTERVAL = 0.2  # Minimum seconds between progress reports
+
 # Search Settings
 DEFAULT_TOP_K = 5  # Default number of results to retrieve
 MAX_TOP_K = 20  # Maximum retrievable results
+SEARCH_WORKERS = 4  # Threads serving async searches
+QUERY_CACHE_SIZE = 256  # Recent query embeddings kept per model
+
+# Reranking Settings
+RERANK_MODEL = "cross-encoder/ms-marco-MiniLM-L-6-v2"
+RERANK_CANDIDATE_POOL = 50  # Max candidates fetched from the vector store for reranking
+RERANK_LATENCY_BUDGET_MS = 300  # Target time for one batched cross-encoder call
+RERANK_CACHE_SIZE = 4096  # Cached (query, chunk) scores
+
+# Diversification (MMR) Settings
+MMR_FETCH_K = 100  # Candidates considered when diversifying results
+MMR_LAMBDA = 0.5  # Relevance vs. diversity trade-off (1.0 = relevance only)
+MMR_MAX_PER_SOURCE = 2  # Results per source file in the GUI's diverse mode
+
+# Live Search Settings
+LIVE_SEARCH_DEBOUNCE_MS = 150  # Quiet time after a keystroke before searching
+LIVE_SEARCH_MIN_CHARS = 3  # Shortest query searched while typing
 
 # Supported document formats
 SUPPORTED_FORMATS = ['.txt', '.pdf', '.docx', '.md']
@@ -70,3 +118,5 @@ SUPPORTED_FORMATS = ['.txt', '.pdf', '.docx', '.md']
 WINDOW_TITLE = "AI Research Assistant - Semantic Search"
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 800
+RESULT_PREVIEW_CHARS = 300  # Characters shown per result until expanded
+RESULTS_RENDER_BATCH = 5  # Results inserted per GUI update
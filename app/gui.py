@@ -6,7 +6,9 @@ Provides interface for dataset selection, embedding configuration, and semantic
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 from pathlib import Path
+import asyncio
 import threading
+from concurrent.futures import Future
 from typing import Optional
 
 from app.config import (
@@ -14,22 +16,38 @@ from app.config import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     EMBEDDING_MODELS,
+    EMBEDDING_BACKENDS,
+    DEFAULT_EMBEDDING_BACKEND,
     VECTOR_STORES,
     DEFAULT_TOP_K,
-    MAX_TOP_K
+    MAX_TOP_K,
+    LIVE_SEARCH_DEBOUNCE_MS,
+    LIVE_SEARCH_MIN_CHARS,
+    RESULT_PREVIEW_CHARS,
+    RESULTS_RENDER_BATCH,
+    MMR_MAX_PER_SOURCE
 )
+from app.chunk_store import ChunkResult
 from app.utils import (
     DocumentLoader,
     TextProcessor,
     EmbeddingEngine,
-    VectorStoreManager,
-    create_semantic_search_system
+    VectorStoreManager
 )
+from app.catalog import IndexCatalog
+from app.build import IndexBuilder, BuildCancelled
 
 
 class AIResearchAssistantGUI:
     """Main GUI application for AI Research Assistant."""
     
+    BUILD_STAGE_LABELS = {
+        "load": "Loading files",
+        "embed": "Embedding chunks",
+        "index": "Writing index",
+        "save": "Saving index"
+    }
+    
     def __init__(self, root):
         """Initialize the GUI application."""
         self.root = root
@@ -42,6 +60,21 @@ class AIResearchAssistantGUI:
         self.vector_manager: Optional[VectorStoreManager] = None
         self.selected_embedding_model: Optional[str] = None
         self.selected_vector_store: Optional[str] = None
+        self.catalog = IndexCatalog()
+        self.saved_indexes: list = []
+        self.build_cancel = threading.Event()
+        
+        # Searches run on a background event loop so the window never blocks
+        self.search_loop = asyncio.new_event_loop()
+        threading.Thread(target=self.search_loop.run_forever, daemon=True).start()
+        self.search_future: Optional[Future] = None
+        self.search_query: Optional[str] = None
+        self.search_generation = 0  # Bumped per search so stale results are dropped
+        self.live_search_after_id: Optional[str] = None
+        self.live_search_shown: Optional[str] = None  # Query whose results are on screen
+        self.last_query_text = ""  # Entry text seen by the last key release
+        self.displayed_results: list = []
+        self.render_id = 0  # Bumped per display so unfinished renders stop
         
         # Setup GUI
         self._setup_styles()
@@ -173,15 +206,52 @@ class AIResearchAssistantGUI:
         self.store_info_label.pack(side=tk.LEFT, padx=10)
         self._update_store_info()
         
+        # Inference backend selection
+        ttk.Label(frame, text="Inference Backend:").grid(row=2, column=0, sticky=tk.W, pady=5)
+        
+        backend_frame = ttk.Frame(frame)
+        backend_frame.grid(row=2, column=1, sticky=(tk.W, tk.E), pady=5, padx=5)
+        
+        self.backend_var = tk.StringVar(value=DEFAULT_EMBEDDING_BACKEND)
+        self.backend_combo = ttk.Combobox(backend_frame, textvariable=self.backend_var,
+                                          state='readonly', width=40)
+        self.backend_combo['values'] = list(EMBEDDING_BACKENDS.keys())
+        self.backend_combo.pack(side=tk.LEFT, padx=5)
+        self.backend_combo.bind('<<ComboboxSelected>>', self._on_backend_selected)
+        
+        self.backend_info_label = ttk.Label(backend_frame, text="", style='Info.TLabel')
+        self.backend_info_label.pack(side=tk.LEFT, padx=10)
+        self._update_backend_info()
+        
+        # Previously built indexes
+        ttk.Label(frame, text="Saved Index:").grid(row=3, column=0, sticky=tk.W, pady=5)
+        
+        saved_frame = ttk.Frame(frame)
+        saved_frame.grid(row=3, column=1, sticky=(tk.W, tk.E), pady=5, padx=5)
+        
+        self.saved_index_var = tk.StringVar()
+        self.saved_index_combo = ttk.Combobox(saved_frame, textvariable=self.saved_index_var,
+                                              state='readonly', width=60)
+        self.saved_index_combo.pack(side=tk.LEFT, padx=5)
+        
+        self.load_btn = ttk.Button(saved_frame, text="Load", command=self._load_saved_index)
+        self.load_btn.pack(side=tk.LEFT, padx=5)
+        self._refresh_saved_indexes()
+        
         # Build index button
         build_frame = ttk.Frame(frame)
-        build_frame.grid(row=2, column=0, columnspan=2, pady=15)
+        build_frame.grid(row=4, column=0, columnspan=2, pady=15)
         
         self.build_btn = ttk.Button(build_frame, text="🔨 Build Index", 
                                     command=self._build_index, style='Action.TButton',
                                     state='disabled')
         self.build_btn.pack(side=tk.LEFT, padx=5)
         
+        # Stops the build at its next checkpoint; building again resumes it
+        self.cancel_build_btn = ttk.Button(build_frame, text="Cancel",
+                                           command=self._cancel_build, state='disabled')
+        self.cancel_build_btn.pack(side=tk.LEFT, padx=5)
+        
         self.progress = ttk.Progressbar(build_frame, mode='indeterminate', length=300)
         self.progress.pack(side=tk.LEFT, padx=10)
         
@@ -204,6 +274,7 @@ class AIResearchAssistantGUI:
         self.query_entry = ttk.Entry(query_frame, width=60, font=('Arial', 10))
         self.query_entry.grid(row=0, column=1, sticky=(tk.W, tk.E), padx=5)
         self.query_entry.bind('<Return>', lambda e: self._perform_search())
+        self.query_entry.bind('<KeyRelease>', self._on_query_changed)
         
         # Top-k selection
         ttk.Label(query_frame, text="Top-K:").grid(row=0, column=2, sticky=tk.W, padx=(20, 5))
@@ -217,6 +288,21 @@ class AIResearchAssistantGUI:
                                      style='Action.TButton', state='disabled')
         self.search_btn.grid(row=0, column=4, padx=10)
         
+        # Live search: query while typing
+        self.live_search_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(query_frame, text="Search as you type",
+                        variable=self.live_search_var).grid(row=0, column=5, padx=5)
+        
+        # Two-stage retrieval: rerank vector candidates with a cross-encoder
+        self.rerank_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(query_frame, text="Rerank",
+                        variable=self.rerank_var).grid(row=0, column=6, padx=5)
+        
+        # Diversify results so overlapping chunks do not fill the top-k
+        self.diverse_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(query_frame, text="Diverse",
+                        variable=self.diverse_var).grid(row=0, column=7, padx=5)
+        
         # Results display
         ttk.Label(frame, text="Results:", style='Section.TLabel').grid(
             row=1, column=0, sticky=tk.W, pady=(15, 5)
@@ -231,6 +317,9 @@ class AIResearchAssistantGUI:
         self.results_text.tag_configure('score', foreground='#27ae60', font=('Arial', 9, 'bold'))
         self.results_text.tag_configure('source', foreground='#3498db', font=('Arial', 9, 'italic'))
         self.results_text.tag_configure('content', foreground='#34495e', font=('Arial', 9))
+        self.results_text.tag_configure('link', foreground='#2980b9', font=('Arial', 9, 'underline'))
+        self.results_text.tag_bind('link', '<Enter>', lambda e: self.results_text.config(cursor='hand2'))
+        self.results_text.tag_bind('link', '<Leave>', lambda e: self.results_text.config(cursor=''))
         
     # Event handlers
     
@@ -253,13 +342,13 @@ class AIResearchAssistantGUI:
             return
         
         try:
-            _, stats = DocumentLoader.load_documents_from_directory(self.data_directory)
+            # Metadata-only scan; documents are parsed once, during the build
+            stats = DocumentLoader.scan_directory(self.data_directory)
             self.dataset_stats = stats
             
             # Display info
             info_text = f"📊 Dataset Statistics:\n"
             info_text += f"  • Total Files: {stats['total_files']}\n"
-            info_text += f"  • Loaded Successfully: {stats['loaded_files']}\n"
             info_text += f"  • Total Size: {stats['total_size_bytes'] / 1024:.2f} KB\n"
             info_text += f"  • File Types: {dict(stats['file_types'])}"
             
@@ -294,49 +383,166 @@ class AIResearchAssistantGUI:
         if store_key and store_key in VECTOR_STORES:
             self.store_info_label.config(text=f"({VECTOR_STORES[store_key]})")
     
+    def _on_backend_selected(self, event=None):
+        """Handle inference backend selection."""
+        self._update_backend_info()
+        
+    def _update_backend_info(self):
+        """Update inference backend info label."""
+        backend_key = self.backend_var.get()
+        if backend_key in EMBEDDING_BACKENDS:
+            self.backend_info_label.config(text=f"({EMBEDDING_BACKENDS[backend_key]})")
+    
+    def _refresh_saved_indexes(self):
+        """Refresh the list of saved indexes from the catalog."""
+        self.saved_indexes = [info for info in self.catalog.list_indexes() if info['model_key']]
+        self.saved_index_combo['values'] = [
+            f"{info['name']} [{info['store_type']}, {info['model_key']}, "
+            f"{info['chunk_count']} chunks, {info['size_bytes'] / 1024 / 1024:.1f} MB]"
+            for info in self.saved_indexes
+        ]
+        self.load_btn.config(state='normal' if self.saved_indexes else 'disabled')
+    
+    def _load_saved_index(self):
+        """Load the selected saved index in a background thread."""
+        selection = self.saved_index_combo.current()
+        if selection < 0:
+            messagebox.showwarning("Warning", "Please select a saved index first!")
+            return
+        
+        info = self.saved_indexes[selection]
+        self.load_btn.config(state='disabled')
+        self.progress.config(mode='indeterminate')
+        self.progress.start(10)
+        self.status_label.config(text=f"Loading {info['name']}...", foreground='orange')
+        
+        def load():
+            try:
+                manager = self.catalog.get(info['name'], info['store_type'])
+                self.root.after(0, lambda: self._index_loaded(manager, info))
+            except Exception as e:
+                # `e` is unbound once the except block ends, so capture the message now
+                error_msg = str(e)
+                self.root.after(0, lambda: self._load_failed(error_msg))
+        
+        threading.Thread(target=load, daemon=True).start()
+    
+    def _index_loaded(self, manager, info):
+        """Handle a saved index finishing loading."""
+        self.progress.stop()
+        self.vector_manager = manager
+        self.selected_embedding_model = info['model_key']
+        self.selected_vector_store = info['store_type']
+        self.status_label.config(
+            text=f"✓ Loaded {info['name']} ({info['chunk_count']} chunks)",
+            foreground='green'
+        )
+        self.search_btn.config(state='normal')
+        self.load_btn.config(state='normal')
+        
+        self.live_search_shown = None
+        self.vector_manager.executor.submit(self.vector_manager.build_lexical_index)
+    
+    def _load_failed(self, error_msg):
+        """Handle a saved index that failed to load."""
+        self.progress.stop()
+        self.status_label.config(text="✗ Load failed", foreground='red')
+        self.load_btn.config(state='normal' if self.saved_indexes else 'disabled')
+        self.search_btn.config(state='normal' if self.vector_manager else 'disabled')
+        messagebox.showerror("Error", f"Failed to load index:\n{error_msg}")
+    
     def _build_index(self):
         """Build vector store index in background thread."""
         if not self.data_directory:
             messagebox.showwarning("Warning", "Please select a dataset directory first!")
             return
         
+        self.selected_embedding_model = self.embedding_var.get()
+        self.selected_vector_store = self.vector_store_var.get()
+        self.build_cancel = threading.Event()
+        builder = IndexBuilder(
+            self.data_directory,
+            self.selected_embedding_model,
+            self.selected_vector_store,
+            self.backend_var.get(),
+            progress=lambda *report: self.root.after(0, lambda: self._show_build_progress(*report)),
+            cancel_event=self.build_cancel
+        )
+        
         # Disable buttons during processing
         self.build_btn.config(state='disabled')
         self.search_btn.config(state='disabled')
-        self.progress.start(10)
-        self.status_label.config(text="Building index...", foreground='orange')
+        self.cancel_build_btn.config(state='normal')
+        self.progress.config(mode='determinate', maximum=100, value=0)
+        self.status_label.config(
+            text="Resuming build..." if builder.has_checkpoint else "Building index...",
+            foreground='orange'
+        )
         
         # Run in background thread
-        threading.Thread(target=self._build_index_thread, daemon=True).start()
+        threading.Thread(target=self._build_index_thread, args=(builder,), daemon=True).start()
     
-    def _build_index_thread(self):
+    def _build_index_thread(self, builder):
         """Background thread for building index."""
         try:
-            self.selected_embedding_model = self.embedding_var.get()
-            self.selected_vector_store = self.vector_store_var.get()
+            # Build, checkpointing as it goes, and persist the index
+            vector_manager, stats = builder.run()
+            self.vector_manager = vector_manager
             
-            # Create semantic search system
-            self.vector_manager, stats = create_semantic_search_system(
-                self.data_directory,
-                self.selected_embedding_model,
-                self.selected_vector_store
-            )
+            # Make the index available from the catalog
+            self.catalog.add(self.vector_manager)
             
             # Update UI on main thread
             self.root.after(0, lambda: self._build_complete(stats))
             
+        except BuildCancelled:
+            self.root.after(0, self._build_cancelled)
         except Exception as e:
-            self.root.after(0, lambda: self._build_failed(str(e)))
+            error_msg = str(e)
+            self.root.after(0, lambda: self._build_failed(error_msg))
+    
+    def _cancel_build(self):
+        """Ask the running build to stop at its next checkpoint."""
+        self.build_cancel.set()
+        self.cancel_build_btn.config(state='disabled')
+        self.status_label.config(text="Cancelling...", foreground='orange')
+    
+    def _show_build_progress(self, stage, done, total, eta):
+        """Show the current build stage, its completion and the estimated time left."""
+        if self.build_cancel.is_set():
+            return
+        
+        self.progress.config(value=100 * done / total if total else 0)
+        text = f"{self.BUILD_STAGE_LABELS.get(stage, stage)} {done}/{total}"
+        if eta is not None and done < total:
+            minutes, seconds = divmod(int(eta), 60)
+            text += f" (about {minutes}m {seconds:02d}s left)"
+        self.status_label.config(text=text, foreground='orange')
+    
+    def _build_cancelled(self):
+        """Handle a build stopped by the user."""
+        self.progress.config(value=0)
+        self.status_label.config(text="Build cancelled - Build Index again to resume", foreground='red')
+        self.cancel_build_btn.config(state='disabled')
+        self.build_btn.config(state='normal' if self.data_directory else 'disabled')
+        self.search_btn.config(state='normal' if self.vector_manager else 'disabled')
     
     def _build_complete(self, stats):
         """Handle successful index build."""
         self.progress.stop()
+        self.progress.config(value=100)
+        self.cancel_build_btn.config(state='disabled')
         self.status_label.config(
             text=f"✓ Index built! ({stats['total_chunks']} chunks)", 
             foreground='green'
         )
         self.search_btn.config(state='normal')
         self.build_btn.config(state='normal')
+        self._refresh_saved_indexes()
+        
+        # Prepare keyword index for live search in the background
+        self.live_search_shown = None
+        self.vector_manager.executor.submit(self.vector_manager.build_lexical_index)
         
         messagebox.showinfo("Success", 
                            f"Index built successfully!\n\n"
@@ -346,8 +552,10 @@ class AIResearchAssistantGUI:
     def _build_failed(self, error_msg):
         """Handle failed index build."""
         self.progress.stop()
+        self.cancel_build_btn.config(state='disabled')
         self.status_label.config(text="✗ Build failed", foreground='red')
-        self.build_btn.config(state='normal')
+        self.build_btn.config(state='normal' if self.data_directory else 'disabled')
+        self.load_btn.config(state='normal' if self.saved_indexes else 'disabled')
         messagebox.showerror("Error", f"Failed to build index:\n{error_msg}")
     
     def _perform_search(self):
@@ -364,43 +572,204 @@ class AIResearchAssistantGUI:
         
         try:
             k = self.topk_var.get()
-            results = self.vector_manager.similarity_search(query, k=k)
-            
-            self._display_results(query, results)
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Search failed:\n{str(e)}")
+        except tk.TclError:
+            messagebox.showwarning("Warning", "Top-K must be a number!")
+            return
+        
+        # Supersede any search still in flight
+        self._cancel_search()
+        
+        self.search_query = query
+        self.search_btn.config(text="Searching...")
+        future = asyncio.run_coroutine_threadsafe(
+            self.vector_manager.asimilarity_search(query, k=k, channel="gui",
+                                                   rerank=self.rerank_var.get(),
+                                                   mmr=self.diverse_var.get(),
+                                                   max_per_source=MMR_MAX_PER_SOURCE),
+            self.search_loop
+        )
+        self.search_future = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, lambda: self._search_complete(query, f))
+        )
+    
+    def _on_query_changed(self, event=None):
+        """Cancel a stale search and, in live mode, schedule a debounced one."""
+        query = self.query_entry.get().strip()
+        # Keys that do not edit the text (Return, arrows, modifiers) change nothing
+        if query == self.last_query_text:
+            return
+        self.last_query_text = query
+        
+        if self.search_query is not None and query != self.search_query:
+            self._cancel_search()
+        
+        if not self.live_search_var.get() or not self.vector_manager:
+            return
+        
+        # Restart the debounce timer on every keystroke
+        if self.live_search_after_id is not None:
+            self.root.after_cancel(self.live_search_after_id)
+        self.live_search_after_id = self.root.after(LIVE_SEARCH_DEBOUNCE_MS, self._perform_live_search)
+    
+    def _perform_live_search(self):
+        """Run a streamed search for the current query text."""
+        self.live_search_after_id = None
+        query = self.query_entry.get()
+        
+        if len(query.strip()) < LIVE_SEARCH_MIN_CHARS or query.strip() in (self.search_query, self.live_search_shown):
+            return
+        
+        try:
+            k = self.topk_var.get()
+        except tk.TclError:
+            return
+        
+        self._cancel_search()
+        
+        generation = self.search_generation
+        self.search_query = query.strip()
+        future = asyncio.run_coroutine_threadsafe(
+            self._stream_search(generation, query, k, rerank=self.rerank_var.get(),
+                                mmr=self.diverse_var.get(), max_per_source=MMR_MAX_PER_SOURCE),
+            self.search_loop
+        )
+        self.search_future = future
+        future.add_done_callback(
+            lambda f: self.root.after(0, lambda: self._search_complete(query, f, live=True))
+        )
+    
+    async def _stream_search(self, generation, query, k, **search_options):
+        """Forward each stage of a streamed search to the main thread."""
+        async for stage, results in self.vector_manager.astream_search(query, k, **search_options):
+            self.root.after(
+                0, lambda s=stage, r=results: self._show_search_stage(generation, query, s, r)
+            )
+    
+    def _show_search_stage(self, generation, query, stage, results):
+        """Display one stage of a streamed search unless it has been superseded."""
+        if generation != self.search_generation:
+            return
+        self._display_results(query.strip(), results, stage=stage)
+    
+    def _cancel_search(self):
+        """Cancel the in-flight search, if any."""
+        if self.search_future is not None and not self.search_future.done():
+            self.search_future.cancel()
+        self.search_generation += 1
+        self.search_future = None
+        self.search_query = None
+        self.search_btn.config(text="Search")
     
-    def _display_results(self, query, results):
-        """Display search results in the text widget."""
+    def _search_complete(self, query, future, live=False):
+        """Handle a finished search on the main thread."""
+        # Ignore searches that were cancelled or superseded
+        if future is not self.search_future or future.cancelled():
+            return
+        
+        self.search_future = None
+        self.search_query = None
+        self.search_btn.config(text="Search")
+        
+        error = future.exception()
+        if error is not None:
+            if not live:
+                messagebox.showerror("Error", f"Search failed:\n{str(error)}")
+            return
+        
+        # Live searches deliver their results stage by stage; either way the
+        # shown query must not be replaced by a later live search for it
+        self.live_search_shown = query.strip()
+        if not live:
+            self._display_results(query, future.result())
+    
+    def _display_results(self, query, results, stage=None):
+        """
+        Display search results in the text widget.
+        
+        Args:
+            query: Query the results belong to
+            results: List of (Document, score) tuples
+            stage: "lexical" or "dense" for streamed live-search results
+        """
+        self.render_id += 1
+        self.displayed_results = results
+        
         self.results_text.config(state='normal')
         self.results_text.delete(1.0, tk.END)
         
         # Header
         self.results_text.insert(tk.END, f"Query: \"{query}\"\n", 'header')
-        self.results_text.insert(tk.END, f"Found {len(results)} results\n\n", 'header')
+        if stage == "lexical":
+            self.results_text.insert(tk.END, f"Found {len(results)} keyword matches "
+                                             f"(semantic results loading...)\n\n", 'header')
+        else:
+            self.results_text.insert(tk.END, f"Found {len(results)} results\n\n", 'header')
         self.results_text.insert(tk.END, "=" * 100 + "\n\n", 'header')
         
-        # Results
-        for idx, (doc, score) in enumerate(results, 1):
+        self.results_text.config(state='disabled')
+        self.results_text.see(1.0)  # Scroll to top
+        
+        score_label = "Keyword Score" if stage == "lexical" else "Relevance Score"
+        self._render_results(self.render_id, score_label, 0)
+    
+    def _render_results(self, render_id, score_label, start):
+        """Insert the next batch of results, yielding to the event loop between batches."""
+        if render_id != self.render_id:
+            return  # A newer display replaced these results
+        
+        end = min(start + RESULTS_RENDER_BATCH, len(self.displayed_results))
+        self.results_text.config(state='normal')
+        
+        for idx in range(start, end):
+            doc, score = self.displayed_results[idx]
+            
             # Result header
-            self.results_text.insert(tk.END, f"[{idx}] ", 'header')
-            self.results_text.insert(tk.END, f"Relevance Score: {score:.4f}\n", 'score')
+            self.results_text.insert(tk.END, f"[{idx + 1}] ", 'header')
+            self.results_text.insert(tk.END, f"{score_label}: {score:.4f}\n", 'score')
             
             # Source
             source = doc.metadata.get('filename', doc.metadata.get('source', 'Unknown'))
             self.results_text.insert(tk.END, f"Source: {source}\n\n", 'source')
             
-            # Content preview (first 300 characters)
-            content = doc.page_content[:300]
-            if len(doc.page_content) > 300:
+            # Content preview; full text is only fetched when expanded
+            content, truncated = self._result_preview(doc)
+            if truncated:
                 content += "..."
-            self.results_text.insert(tk.END, f"{content}\n", 'content')
+            self.results_text.insert(tk.END, f"{content}\n", ('content', f'body{idx}'))
+            if truncated:
+                self.results_text.insert(tk.END, "[Show full text]\n", ('link', f'expand{idx}'))
+                self.results_text.tag_bind(f'expand{idx}', '<Button-1>',
+                                           lambda e, i=idx: self._expand_result(i))
             
             self.results_text.insert(tk.END, "\n" + "-" * 100 + "\n\n", 'content')
         
         self.results_text.config(state='disabled')
-        self.results_text.see(1.0)  # Scroll to top
+        
+        if end < len(self.displayed_results):
+            self.root.after(1, lambda: self._render_results(render_id, score_label, end))
+    
+    @staticmethod
+    def _result_preview(doc):
+        """Return (preview text, truncated) for a search result."""
+        if isinstance(doc, ChunkResult):
+            return doc.preview(RESULT_PREVIEW_CHARS)
+        return doc.page_content[:RESULT_PREVIEW_CHARS], len(doc.page_content) > RESULT_PREVIEW_CHARS
+    
+    def _expand_result(self, idx):
+        """Replace a result's preview with its full text."""
+        body = self.results_text.tag_ranges(f'body{idx}')
+        link = self.results_text.tag_ranges(f'expand{idx}')
+        if not body or idx >= len(self.displayed_results):
+            return
+        
+        doc, _ = self.displayed_results[idx]
+        self.results_text.config(state='normal')
+        if link:
+            self.results_text.delete(link[0], link[1])
+        self.results_text.delete(body[0], body[1])
+        self.results_text.insert(body[0], f"{doc.page_content}\n", ('content', f'body{idx}'))
+        self.results_text.config(state='disabled')
 
 
 def main():
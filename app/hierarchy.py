@@ -0,0 +1,120 @@
+"""
+Hierarchical retrieval module for AI Research Assistant
+Routes a query to its most similar files through a small index of per-file
+centroid vectors, then scores only the chunks of those files.
+"""
+
+from typing import Tuple
+
+import numpy as np
+import faiss
+
+from app.chunk_store import ChunkStore
+
+# Chunks gathered per step when summing centroids, bounding temporary memory
+CENTROID_BLOCK = 65536
+
+
+def stored_vectors(index: faiss.Index) -> np.ndarray:
+    """Zero-copy (n, d) view of a flat index's vectors, or a copy for other index types."""
+    if isinstance(index, faiss.IndexFlat):
+        return faiss.rev_swig_ptr(index.get_xb(), index.ntotal * index.d).reshape(index.ntotal, index.d)
+    return index.reconstruct_n(0, index.ntotal)
+
+
+class DocumentIndex:
+    """
+    Two-level index over a flat FAISS chunk index.
+
+    Each source file is represented by the normalized mean of its chunk
+    vectors. A query first searches these centroids for the best files, and
+    exact distances are then computed only for the chunks of those files.
+    """
+
+    def __init__(self, chunk_index: faiss.Index, chunk_store: ChunkStore):
+        """
+        Build centroids from the vectors already stored in a chunk index.
+
+        Args:
+            chunk_index: FAISS index holding one vector per chunk, in chunk id order
+            chunk_store: Chunk store giving each chunk's source file id
+        """
+        self.chunk_index = chunk_index
+        self.chunk_store = chunk_store
+
+        num_chunks = chunk_index.ntotal
+        file_ids = np.frombuffer(chunk_store.file_ids(), dtype=np.int32)[:num_chunks]
+        num_files = max(chunk_store.num_files, 1)
+
+        # Group chunk ids by file: file f owns chunk_order[starts[f]:starts[f + 1]]
+        self.chunk_order = np.argsort(file_ids, kind='stable').astype(np.int64)
+        counts = np.bincount(file_ids, minlength=num_files)
+        self.starts = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+
+        self._vectors = stored_vectors(chunk_index)
+        centroids = np.zeros((num_files, chunk_index.d), dtype=np.float32)
+        present = np.flatnonzero(counts)
+        ends = self.starts[present + 1]
+        first = 0
+        while first < len(present):
+            # Sum whole files at a time, gathering about CENTROID_BLOCK chunks per step
+            begin = self.starts[present[first]]
+            last = max(int(np.searchsorted(ends, begin + CENTROID_BLOCK, side='right')), first + 1)
+            files = present[first:last]
+            block = self._vectors[self.chunk_order[begin:ends[last - 1]]]
+            centroids[files] = np.add.reduceat(block, self.starts[files] - begin, axis=0)
+            first = last
+        norms = np.linalg.norm(centroids, axis=1, keepdims=True)
+        centroids /= np.maximum(norms, 1e-12)
+
+        # Files without chunks keep a zero centroid and contribute no chunks
+        self.file_index = faiss.IndexFlatIP(chunk_index.d)
+        self.file_index.add(centroids)
+
+    @property
+    def num_files(self) -> int:
+        """Number of files in the document-level index."""
+        return self.file_index.ntotal
+
+    @property
+    def nbytes(self) -> int:
+        """Memory used by the chunk grouping and the centroids (chunk vectors are shared)."""
+        return self.chunk_order.nbytes + self.starts.nbytes + self.file_index.ntotal * self.file_index.d * 4
+
+    def search(self, query_vector: np.ndarray, k: int, top_files: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Search chunks of the files whose centroids best match the query.
+
+        Args:
+            query_vector: Query embedding, shape (d,)
+            k: Number of chunks to return
+            top_files: Number of files whose chunks are searched
+
+        Returns:
+            Tuple of (chunk ids, squared L2 distances), nearest first, matching
+            the scores of a flat FAISS search
+        """
+        query = np.asarray(query_vector, dtype=np.float32).reshape(1, -1)
+        top_files = min(top_files, self.num_files)
+        if k <= 0 or top_files <= 0:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.float32)
+
+        unit_query = query / max(float(np.linalg.norm(query)), 1e-12)
+        _, files = self.file_index.search(unit_query, top_files)
+        files = files[0][files[0] != -1]
+
+        chunk_ids = np.concatenate(
+            [self.chunk_order[self.starts[f]:self.starts[f + 1]] for f in files]
+        ) if len(files) else np.empty(0, dtype=np.int64)
+        if chunk_ids.size == 0:
+            return chunk_ids, np.empty(0, dtype=np.float32)
+
+        vectors = self._vectors[chunk_ids]
+        distances = ((vectors - query) ** 2).sum(axis=1)
+
+        if chunk_ids.size > k:
+            best = np.argpartition(distances, k - 1)[:k]
+        else:
+            best = np.arange(chunk_ids.size)
+        best = best[np.argsort(distances[best], kind='stable')]
+        return chunk_ids[best], distances[best]
@@ -0,0 +1,117 @@
+"""
+Lexical search module for AI Research Assistant
+Provides a lightweight inverted index over a ChunkStore for instant keyword
+hits while dense results are still being computed.
+"""
+
+import math
+import re
+import sys
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.chunk_store import ChunkStore, ChunkResult
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase word tokens."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+class LexicalIndex:
+    """
+    Inverted index from tokens to the chunk ids that contain them.
+
+    Scores are the sum of IDF weights of matched query terms. The last query
+    term is treated as a prefix while the user is still typing it.
+    """
+
+    def __init__(self, chunk_store: ChunkStore, max_prefix_terms: int = 50):
+        """
+        Build the index from all chunks in a store.
+
+        Args:
+            chunk_store: Store whose chunks are indexed
+            max_prefix_terms: Maximum vocabulary terms a trailing prefix expands to
+        """
+        self.chunk_store = chunk_store
+        self.max_prefix_terms = max_prefix_terms
+
+        postings: Dict[str, List[int]] = {}
+        for chunk_id in range(len(chunk_store)):
+            for token in set(tokenize(chunk_store.get_text(chunk_id))):
+                postings.setdefault(token, []).append(chunk_id)
+
+        num_chunks = max(len(chunk_store), 1)
+        self.postings: Dict[str, np.ndarray] = {
+            token: np.asarray(ids, dtype=np.int32) for token, ids in postings.items()
+        }
+        self.idf: Dict[str, float] = {
+            token: math.log(1.0 + num_chunks / len(ids)) for token, ids in postings.items()
+        }
+        self.vocabulary = sorted(self.postings)
+
+        # Postings arrays plus the per-term strings, floats and dictionary slots
+        self.nbytes = (
+            sum(sys.getsizeof(token) + sys.getsizeof(ids) + sys.getsizeof(self.idf[token])
+                for token, ids in self.postings.items())
+            + sys.getsizeof(self.postings) + sys.getsizeof(self.idf) + sys.getsizeof(self.vocabulary)
+        )
+
+    def _expand_prefix(self, prefix: str) -> List[str]:
+        """Return vocabulary terms starting with prefix."""
+        terms = []
+        position = bisect_left(self.vocabulary, prefix)
+        while (
+            position < len(self.vocabulary)
+            and len(terms) < self.max_prefix_terms
+            and self.vocabulary[position].startswith(prefix)
+        ):
+            terms.append(self.vocabulary[position])
+            position += 1
+        return terms
+
+    def search(self, query: str, k: int = 5) -> List[Tuple[ChunkResult, float]]:
+        """
+        Find chunks containing the query terms.
+
+        Args:
+            query: Search query (possibly still being typed)
+            k: Number of top results to return
+
+        Returns:
+            List of (ChunkResult, keyword_score) tuples, best first
+        """
+        tokens = tokenize(query)
+        if not tokens or k <= 0:
+            return []
+
+        # A query not ending in whitespace may have an unfinished last word
+        complete = tokens if query[-1:].isspace() else tokens[:-1]
+        term_groups = [[token] for token in complete]
+        if len(complete) < len(tokens):
+            term_groups.append(self._expand_prefix(tokens[-1]))
+
+        scores = np.zeros(len(self.chunk_store), dtype=np.float32)
+        for terms in term_groups:
+            # Credit each chunk once per query term, using the best expansion
+            group_scores = np.zeros_like(scores)
+            for term in terms:
+                ids = self.postings.get(term)
+                if ids is not None:
+                    # Postings hold unique ids, so fancy assignment is safe
+                    group_scores[ids] = np.maximum(group_scores[ids], self.idf[term])
+            scores += group_scores
+
+        matched = np.flatnonzero(scores)
+        if matched.size == 0:
+            return []
+        if matched.size > k:
+            matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        matched = matched[np.argsort(-scores[matched], kind='stable')]
+
+        return [(self.chunk_store.result(int(i)), float(scores[i])) for i in matched]
@@ -0,0 +1,80 @@
+"""
+Diversification module for AI Research Assistant
+Selects search results by maximal marginal relevance (MMR) over the stored
+candidate vectors, so overlapping chunks do not crowd out the top-k.
+"""
+
+from typing import List, Optional
+
+import numpy as np
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale rows to unit length so dot products are cosine similarities."""
+    norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+    return vectors / np.maximum(norms, 1e-12)
+
+
+def mmr_select(
+    query_vector: np.ndarray,
+    candidate_vectors: np.ndarray,
+    k: int,
+    lambda_mult: float = 0.5,
+    sources: Optional[np.ndarray] = None,
+    max_per_source: Optional[int] = None
+) -> List[int]:
+    """
+    Pick k diverse candidates by maximal marginal relevance.
+
+    Each step takes the candidate maximizing
+    lambda_mult * sim(query, c) - (1 - lambda_mult) * max sim(c, selected),
+    keeping the running max similarity to the selection as one vector, so a
+    step costs a single matrix-vector product.
+
+    Args:
+        query_vector: Query embedding, shape (d,)
+        candidate_vectors: Candidate embeddings, shape (n, d)
+        k: Number of candidates to select
+        lambda_mult: 1.0 ranks by relevance only, 0.0 by diversity only
+        sources: Integer source id per candidate, used with max_per_source
+        max_per_source: Maximum selected candidates sharing a source (None for no cap)
+
+    Returns:
+        Indices into candidate_vectors in selection order
+    """
+    n = len(candidate_vectors)
+    if n == 0 or k <= 0:
+        return []
+
+    candidates = _normalize(np.asarray(candidate_vectors, dtype=np.float32))
+    query = _normalize(np.asarray(query_vector, dtype=np.float32).reshape(-1))
+    relevance = candidates @ query
+
+    max_similarity = np.full(n, -np.inf, dtype=np.float32)
+    available = np.ones(n, dtype=bool)
+    if sources is not None and max_per_source is not None:
+        sources = np.asarray(sources)
+        source_counts = {}
+    else:
+        sources = None
+
+    selected = []
+    while len(selected) < k and available.any():
+        if selected:
+            scores = lambda_mult * relevance - (1.0 - lambda_mult) * max_similarity
+        else:
+            scores = relevance.copy()
+        scores[~available] = -np.inf
+        best = int(np.argmax(scores))
+
+        selected.append(best)
+        available[best] = False
+        np.maximum(max_similarity, candidates @ candidates[best], out=max_similarity)
+
+        if sources is not None:
+            source = sources[best]
+            source_counts[source] = source_counts.get(source, 0) + 1
+            if source_counts[source] >= max_per_source:
+                available &= sources != source
+
+    return selected
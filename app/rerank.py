@@ -0,0 +1,156 @@
+"""
+Reranking module for AI Research Assistant
+Rescores a candidate pool from the vector store with a cross-encoder,
+keeping the pool small enough to fit a latency budget.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from langchain_core.documents import Document
+
+from app.config import (
+    RERANK_MODEL,
+    RERANK_CANDIDATE_POOL,
+    RERANK_LATENCY_BUDGET_MS,
+    RERANK_CACHE_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+# Scores a batch of (query, passage) pairs; higher is more relevant
+PairScorer = Callable[[List[Tuple[str, str]]], Sequence[float]]
+
+
+class Reranker:
+    """
+    Second-stage reranker over first-stage vector search candidates.
+
+    All uncached pairs are scored in one batched call. The candidate pool
+    shrinks when the measured per-pair cost would exceed the latency budget.
+    """
+
+    def __init__(
+        self,
+        scorer: Optional[PairScorer] = None,
+        model_name: str = RERANK_MODEL,
+        candidate_pool: int = RERANK_CANDIDATE_POOL,
+        latency_budget_ms: float = RERANK_LATENCY_BUDGET_MS,
+        cache_size: int = RERANK_CACHE_SIZE
+    ):
+        """
+        Initialize reranker.
+
+        Args:
+            scorer: Callable scoring (query, passage) pairs; defaults to a
+                sentence-transformers CrossEncoder loaded on first use
+            model_name: Cross-encoder model used by the default scorer
+            candidate_pool: Maximum number of candidates to rescore
+            latency_budget_ms: Target time for one scoring call
+            cache_size: Number of (query, chunk) scores to keep
+        """
+        self.model_name = model_name
+        self.candidate_pool = candidate_pool
+        self.latency_budget_ms = latency_budget_ms
+        self.cache_size = cache_size
+
+        self._scorer = scorer
+        self._seconds_per_pair: Optional[float] = None
+        self._cache: "OrderedDict[Tuple[str, object], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+
+    def _get_scorer(self) -> PairScorer:
+        """Return the configured scorer, loading the default model lazily."""
+        with self._load_lock:
+            if self._scorer is None:
+                from sentence_transformers import CrossEncoder
+
+                logger.info(f"Loading reranker model: {self.model_name}")
+                model = CrossEncoder(self.model_name, device='cpu')
+                self._scorer = lambda batch: model.predict(batch, batch_size=len(batch))
+        return self._scorer
+
+    def pool_size(self, k: int) -> int:
+        """
+        Number of candidates to fetch for a top-k rerank.
+
+        Args:
+            k: Number of results that will be returned
+
+        Returns:
+            Pool size between k and candidate_pool, bounded by the latency budget
+        """
+        pool = max(k, self.candidate_pool)
+        if self._seconds_per_pair:
+            affordable = int(self.latency_budget_ms / 1000.0 / self._seconds_per_pair)
+            pool = min(pool, affordable)
+        return max(k, pool)
+
+    @staticmethod
+    def _chunk_key(doc: Document) -> object:
+        """Stable identifier for a candidate chunk."""
+        cache_key = getattr(doc, 'cache_key', None)
+        if cache_key is not None:
+            return cache_key
+        digest = hashlib.sha1(doc.page_content.encode('utf-8')).hexdigest()
+        return (doc.metadata.get('source'), digest)
+
+    def rerank(
+        self,
+        query: str,
+        candidates: List[Tuple[Document, float]],
+        k: int
+    ) -> List[Tuple[Document, float]]:
+        """
+        Rescore candidates and return the best k.
+
+        Args:
+            query: Search query
+            candidates: First-stage (Document, score) tuples
+            k: Number of results to return
+
+        Returns:
+            List of (Document, rerank_score) tuples (higher is better)
+        """
+        docs = [doc for doc, _ in candidates]
+        keys = [(query, self._chunk_key(doc)) for doc in docs]
+
+        with self._lock:
+            scores = [self._cache.get(key) for key in keys]
+        missing = [i for i, score in enumerate(scores) if score is None]
+
+        if missing:
+            scorer = self._get_scorer()
+            pairs = [(query, docs[i].page_content) for i in missing]
+            start = time.perf_counter()
+            batch_scores = scorer(pairs)
+            elapsed = time.perf_counter() - start
+
+            # Exponential moving average of the per-pair cost drives pool_size
+            per_pair = elapsed / len(missing)
+            if self._seconds_per_pair is None:
+                self._seconds_per_pair = per_pair
+            else:
+                self._seconds_per_pair = 0.7 * self._seconds_per_pair + 0.3 * per_pair
+
+            with self._lock:
+                for i, score in zip(missing, batch_scores):
+                    scores[i] = float(score)
+                    self._cache[keys[i]] = scores[i]
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+            logger.info(f"Reranked {len(missing)} new candidates in {elapsed * 1000:.1f} ms")
+
+        order = sorted(range(len(docs)), key=lambda i: scores[i], reverse=True)[:k]
+        return [(docs[i], scores[i]) for i in order]
+
+    def clear_cache(self) -> None:
+        """Forget cached scores, e.g. after the underlying index changes."""
+        with self._lock:
+            self._cache.clear()
@@ -4,10 +4,24 @@ Handles document loading, text processing, embedding generation, and vector stor
 """
 
 import os
+import re
+import json
+import time
+import uuid
+import shutil
+import asyncio
+import threading
+from collections import OrderedDict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, AsyncIterator, Callable, Union
 import logging
 
+import numpy as np
+import faiss
+from chromadb.api.client import SharedSystemClient
+
 # LangChain imports
 from langchain_text_splitters import RecursiveCharacterTextSplitter
 from langchain_community.embeddings import HuggingFaceEmbeddings
@@ -23,13 +37,36 @@ from app.config import (
     CHUNK_OVERLAP, 
     SUPPORTED_FORMATS,
     VECTOR_STORE_DIR,
-    EMBEDDING_MODELS
+    EMBEDDING_MODELS,
+    EMBED_BATCH_SIZE,
+    SEARCH_WORKERS,
+    QUERY_CACHE_SIZE,
+    EMBEDDINGS_DIR,
+    EMBEDDING_BACKENDS,
+    DEFAULT_EMBEDDING_BACKEND,
+    MODEL_POOL_MEMORY_MB,
+    EMBEDDING_PARITY_THRESHOLD,
+    CHROMA_BATCH_SIZE,
+    DEFAULT_INDEX_NAME,
+    INDEX_VERSIONS_KEPT,
+    MMR_FETCH_K,
+    MMR_LAMBDA,
+    EXPORT_DIR
 )
+from app.chunk_store import ChunkStore
+from app.hierarchy import DocumentIndex, stored_vectors
+from app.columnar import EmbeddingFile, EXPORT_BATCH_SIZE, read_export_info, write_embeddings
+from app.lexical import LexicalIndex
+from app.mmr import mmr_select
+from app.rerank import Reranker
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# SQLite file chromadb writes into every persist directory
+CHROMA_DB_FILE = "chroma.sqlite3"
+
 
 class DocumentLoader:
     """Handles loading documents from various file formats."""
@@ -120,24 +157,58 @@ class DocumentLoader:
             'file_types': {}
         }
         
-        for file_path in Path(directory).rglob('*'):
-            if file_path.is_file() and file_path.suffix.lower() in SUPPORTED_FORMATS:
-                stats['total_files'] += 1
-                stats['total_size_bytes'] += file_path.stat().st_size
-                
-                # Track file type
-                ext = file_path.suffix.lower()
-                stats['file_types'][ext] = stats['file_types'].get(ext, 0) + 1
-                
-                doc = cls.load_document(file_path)
-                if doc:
-                    documents.append(doc)
-                    stats['loaded_files'] += 1
-                else:
-                    stats['failed_files'] += 1
+        for file_path in cls.iter_supported_files(directory):
+            cls._count_file(stats, file_path)
+            
+            doc = cls.load_document(file_path)
+            if doc:
+                documents.append(doc)
+                stats['loaded_files'] += 1
+            else:
+                stats['failed_files'] += 1
         
         logger.info(f"Loaded {stats['loaded_files']}/{stats['total_files']} documents")
         return documents, stats
+    
+    @staticmethod
+    def iter_supported_files(directory: Path):
+        """Yield paths of all supported document files under a directory."""
+        for file_path in Path(directory).rglob('*'):
+            if file_path.suffix.lower() in SUPPORTED_FORMATS and file_path.is_file():
+                yield file_path
+    
+    @staticmethod
+    def _count_file(stats: Dict, file_path: Path) -> None:
+        """Add a file's size and type to a statistics dictionary."""
+        stats['total_files'] += 1
+        stats['total_size_bytes'] += file_path.stat().st_size
+        
+        # Track file type
+        ext = file_path.suffix.lower()
+        stats['file_types'][ext] = stats['file_types'].get(ext, 0) + 1
+    
+    @classmethod
+    def scan_directory(cls, directory: Path) -> Dict:
+        """
+        Collect dataset statistics from file metadata only, without parsing.
+        
+        Args:
+            directory: Path to directory containing documents
+            
+        Returns:
+            Statistics dictionary with file count, total size and file types
+        """
+        stats = {
+            'total_files': 0,
+            'total_size_bytes': 0,
+            'file_types': {}
+        }
+        
+        for file_path in cls.iter_supported_files(directory):
+            cls._count_file(stats, file_path)
+        
+        logger.info(f"Found {stats['total_files']} supported files in {directory}")
+        return stats
 
 
 class TextProcessor:
@@ -173,157 +244,1300 @@ class TextProcessor:
         return chunks
 
 
+# Sentences used to compare optimized backends against the PyTorch model
+PARITY_PROBES = [
+    "What is machine learning?",
+    "Neural networks learn hierarchical representations of data.",
+    "The committee approved the budget after a long discussion."
+]
+
+
+def _load_embeddings(model_key: str, backend: str) -> HuggingFaceEmbeddings:
+    """
+    Load a Hugging Face embedding model for CPU inference.
+    
+    Args:
+        model_key: Key from EMBEDDING_MODELS config
+        backend: Key from EMBEDDING_BACKENDS config
+        
+    Returns:
+        HuggingFaceEmbeddings wrapping the loaded model
+    """
+    model_name = EMBEDDING_MODELS[model_key]["name"]
+    model_kwargs = {'device': 'cpu'}
+    
+    if backend in ("onnx", "onnx-int8"):
+        model_kwargs['backend'] = 'onnx'
+    
+    if backend == "onnx-int8":
+        # Export once to a local directory holding the quantized ONNX graph
+        from sentence_transformers import SentenceTransformer, export_dynamic_quantized_onnx_model
+        
+        export_dir = EMBEDDINGS_DIR / f"{model_key}-onnx"
+        quantized_file = "onnx/model_qint8_avx2.onnx"
+        if not (export_dir / quantized_file).exists():
+            logger.info(f"Exporting quantized ONNX model to {export_dir}")
+            onnx_model = SentenceTransformer(model_name, device='cpu', backend='onnx')
+            onnx_model.save_pretrained(str(export_dir))
+            export_dynamic_quantized_onnx_model(onnx_model, "avx2", str(export_dir))
+        model_name = str(export_dir)
+        model_kwargs['model_kwargs'] = {'file_name': quantized_file}
+    
+    embeddings = HuggingFaceEmbeddings(
+        model_name=model_name,
+        model_kwargs=model_kwargs,
+        encode_kwargs={'normalize_embeddings': True}
+    )
+    
+    if backend == "int8":
+        import torch
+        
+        embeddings.client = torch.quantization.quantize_dynamic(
+            embeddings.client, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    
+    return embeddings
+
+
+def _estimate_model_bytes(model_key: str, embeddings: HuggingFaceEmbeddings) -> int:
+    """Estimate resident memory of a loaded model from its parameters."""
+    try:
+        # Quantized Linear layers keep packed weights outside parameters(),
+        # so this undercounts int8 models slightly
+        total = sum(
+            tensor.numel() * tensor.element_size()
+            for tensor in list(embeddings.client.parameters()) + list(embeddings.client.buffers())
+        )
+    except AttributeError:
+        total = 0
+    
+    if total == 0:
+        # ONNX sessions expose no torch tensors; fall back to the configured size
+        total = EMBEDDING_MODELS[model_key]["size_mb"] * 1024 * 1024
+    return total
+
+
+class ModelPool:
+    """
+    Process-wide pool of loaded embedding models.
+    
+    Models are keyed by (model_key, backend) and evicted least-recently-used
+    once their estimated memory exceeds the budget. An evicted model stays
+    alive for engines that still hold it; the pool only drops its reference.
+    """
+    
+    def __init__(self, memory_budget_mb: int = MODEL_POOL_MEMORY_MB):
+        """
+        Initialize model pool.
+        
+        Args:
+            memory_budget_mb: Memory budget for pooled models in megabytes
+        """
+        self.memory_budget_bytes = memory_budget_mb * 1024 * 1024
+        self._models: "OrderedDict[Tuple[str, str], Tuple[HuggingFaceEmbeddings, int]]" = OrderedDict()
+        self._diverged: set = set()  # (model_key, backend) pairs that failed to load or diverged
+        self._load_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._lock = threading.RLock()
+    
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated memory of all pooled models."""
+        with self._lock:
+            return sum(size for _, size in self._models.values())
+    
+    def loaded(self) -> List[Tuple[str, str]]:
+        """List pooled (model_key, backend) pairs, least recently used first."""
+        with self._lock:
+            return list(self._models)
+    
+    def get(self, model_key: str, backend: str = DEFAULT_EMBEDDING_BACKEND) -> HuggingFaceEmbeddings:
+        """
+        Return a warm model, loading it on first use.
+        
+        Non-PyTorch backends are checked against the PyTorch model and fall
+        back to it when they fail to load or their embeddings diverge.
+        
+        Args:
+            model_key: Key from EMBEDDING_MODELS config
+            backend: Key from EMBEDDING_BACKENDS config
+            
+        Returns:
+            HuggingFaceEmbeddings for the model
+        """
+        if model_key not in EMBEDDING_MODELS:
+            raise ValueError(f"Unknown model: {model_key}")
+        if backend not in EMBEDDING_BACKENDS:
+            raise ValueError(f"Unknown embedding backend: {backend}")
+        
+        key = (model_key, backend)
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        diverged, embeddings = self._lookup(key)
+        if diverged:
+            return self.get(model_key, "torch")
+        if embeddings is not None:
+            return embeddings
+        
+        # Only misses wait: a model loads once, while warm lookups and loads
+        # of other models go ahead
+        with load_lock:
+            diverged, embeddings = self._lookup(key)
+            if diverged:
+                return self.get(model_key, "torch")
+            if embeddings is not None:
+                return embeddings
+            
+            logger.info(f"Loading embedding model: {EMBEDDING_MODELS[model_key]['name']} ({backend})")
+            if backend == "torch":
+                embeddings = _load_embeddings(model_key, backend)
+            else:
+                try:
+                    embeddings = _load_embeddings(model_key, backend)
+                except Exception as e:
+                    # e.g. optimum/onnxruntime missing or the model cannot be exported
+                    logger.warning(f"Could not load {backend} backend for {model_key} ({e}); using PyTorch")
+                    with self._lock:
+                        self._diverged.add(key)
+                    return self.get(model_key, "torch")
+                
+                if not self._check_parity(model_key, embeddings):
+                    logger.warning(f"{backend} embeddings for {model_key} diverge from PyTorch; using PyTorch")
+                    with self._lock:
+                        self._diverged.add(key)
+                    return self.get(model_key, "torch")
+            
+            with self._lock:
+                self._models[key] = (embeddings, _estimate_model_bytes(model_key, embeddings))
+                self._evict(keep=key)
+            return embeddings
+    
+    def _lookup(self, key: Tuple[str, str]) -> Tuple[bool, Optional[HuggingFaceEmbeddings]]:
+        """Return whether a backend is unusable for a model, and the pooled model if warm."""
+        with self._lock:
+            if key in self._diverged:
+                return True, None
+            if key in self._models:
+                self._models.move_to_end(key)
+                return False, self._models[key][0]
+            return False, None
+    
+    def _check_parity(self, model_key: str, embeddings: HuggingFaceEmbeddings) -> bool:
+        """Compare an optimized model's embeddings with the pooled PyTorch model's."""
+        reference = self.get(model_key, "torch")
+        
+        expected = np.asarray(reference.embed_documents(PARITY_PROBES), dtype=np.float32)
+        actual = np.asarray(embeddings.embed_documents(PARITY_PROBES), dtype=np.float32)
+        # Both sides are normalized, so row-wise dot products are cosines
+        similarity = float(np.min(np.sum(expected * actual, axis=1)))
+        
+        logger.info(f"Embedding parity for {model_key}: min cosine {similarity:.4f}")
+        return similarity >= EMBEDDING_PARITY_THRESHOLD
+    
+    def _evict(self, keep: Tuple[str, str]) -> None:
+        """Drop least recently used models until the pool fits its budget."""
+        while len(self._models) > 1 and self.memory_bytes > self.memory_budget_bytes:
+            oldest = next(key for key in self._models if key != keep)
+            del self._models[oldest]
+            logger.info(f"Evicted embedding model from pool: {oldest[0]} ({oldest[1]})")
+    
+    def clear(self) -> None:
+        """Drop all pooled models."""
+        with self._lock:
+            self._models.clear()
+
+
+# Shared by every EmbeddingEngine in the process
+MODEL_POOL = ModelPool()
+
+
 class EmbeddingEngine:
     """Handles embedding generation using Hugging Face models."""
     
-    def __init__(self, model_key: str):
+    def __init__(self, model_key: str, backend: str = DEFAULT_EMBEDDING_BACKEND):
         """
         Initialize embedding engine with specified model.
         
         Args:
             model_key: Key from EMBEDDING_MODELS config
+            backend: Inference backend key from EMBEDDING_BACKENDS config
         """
         if model_key not in EMBEDDING_MODELS:
             raise ValueError(f"Unknown model: {model_key}")
         
         self.model_key = model_key
         self.model_name = EMBEDDING_MODELS[model_key]["name"]
+        self.dimension = EMBEDDING_MODELS[model_key]["dimension"]
+        self.backend = backend
         
-        logger.info(f"Loading embedding model: {self.model_name}")
-        self.embeddings = HuggingFaceEmbeddings(
-            model_name=self.model_name,
-            model_kwargs={'device': 'cpu'},
-            encode_kwargs={'normalize_embeddings': True}
-        )
+        # Warm models are reused across index builds
+        self.embeddings = MODEL_POOL.get(model_key, backend)
+        
+        # Recent query embeddings, so retyped or revisited queries skip the model
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
     
     def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Embed a list of documents."""
         return self.embeddings.embed_documents(texts)
     
+    def embed_documents_array(self, texts: List[str], batch_size: int = EMBED_BATCH_SIZE) -> np.ndarray:
+        """
+        Embed a list of documents in batches into a float32 matrix.
+        
+        Args:
+            texts: Texts to embed
+            batch_size: Number of texts embedded per model call
+            
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            batch = texts[start:start + batch_size]
+            vectors[start:start + len(batch)] = self.embeddings.embed_documents(batch)
+        return vectors
+    
     def embed_query(self, text: str) -> List[float]:
-        """Embed a single query."""
-        return self.embeddings.embed_query(text)
+        """Embed a single query, reusing the embedding of a recently seen query."""
+        key = " ".join(text.split())
+        with self._query_cache_lock:
+            cached = self._query_cache.get(key)
+            if cached is not None:
+                self._query_cache.move_to_end(key)
+                return cached
+        
+        vector = self.embeddings.embed_query(key)
+        self._cache_query(key, vector)
+        return vector
+    
+    def embed_queries(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed several queries, computing all cache misses in one model call.
+        
+        Sentence-transformers models encode queries and documents the same
+        way, so misses are batched through embed_documents.
+        """
+        keys = [" ".join(text.split()) for text in texts]
+        with self._query_cache_lock:
+            vectors = {key: self._query_cache[key] for key in keys if key in self._query_cache}
+        
+        missing = list(dict.fromkeys(key for key in keys if key not in vectors))
+        if missing:
+            for key, vector in zip(missing, self.embeddings.embed_documents(missing)):
+                self._cache_query(key, vector)
+                vectors[key] = vector
+        
+        return np.asarray([vectors[key] for key in keys], dtype=np.float32)
+    
+    def _cache_query(self, key: str, vector: List[float]) -> None:
+        """Store a query embedding, evicting the least recently used one."""
+        with self._query_cache_lock:
+            self._query_cache[key] = vector
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+
+
+class LiveIndex:
+    """Immutable bundle of the objects a search reads, swapped as a unit on reload."""
+    
+    __slots__ = ("vector_store", "chunk_store", "version", "document_index")
+    
+    def __init__(
+        self,
+        vector_store=None,
+        chunk_store: Optional[ChunkStore] = None,
+        version: Optional[str] = None,
+        document_index: Optional[DocumentIndex] = None
+    ):
+        self.vector_store = vector_store
+        self.chunk_store = chunk_store
+        self.version = version
+        self.document_index = document_index
+    
+    def at_version(self, version: Optional[str]) -> "LiveIndex":
+        """Return the same index labelled with a snapshot version."""
+        return LiveIndex(self.vector_store, self.chunk_store, version, self.document_index)
 
 
 class VectorStoreManager:
-    """Manages vector store creation, saving, and loading."""
+    """
+    Manages vector store creation, saving, and loading.
+    
+    FAISS indexes are kept as a raw faiss index plus a compact ChunkStore;
+    ChromaDB keeps chunks in its own database. Saved indexes are versioned
+    snapshots under <name>_<store>/versions/, published by rewriting the
+    CURRENT pointer file, so a reload can swap in a new build while
+    searches keep running against the old one.
+    """
+    
+    CURRENT_FILE = "CURRENT"
+    MANIFEST_FILE = "manifest.json"
     
-    def __init__(self, store_type: str, embedding_engine: EmbeddingEngine):
+    def __init__(
+        self,
+        store_type: str,
+        embedding_engine: EmbeddingEngine,
+        executor: Optional[Executor] = None,
+        reranker: Optional[Reranker] = None
+    ):
         """
         Initialize vector store manager.
         
         Args:
             store_type: Type of vector store ('FAISS' or 'ChromaDB')
             embedding_engine: Initialized EmbeddingEngine instance
+            executor: Executor for async searches (a thread pool is created on first use)
+            reranker: Reranker for two-stage searches (a cross-encoder is created on first use)
         """
         self.store_type = store_type
         self.embedding_engine = embedding_engine
-        self.vector_store = None
+        self._live = LiveIndex()
+        self.index_name: Optional[str] = None
+        self._reload_lock = threading.Lock()
+        self._executor = executor
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._lexical_index: Optional[LexicalIndex] = None
+        self._lexical_lock = threading.Lock()
+        self.reranker = reranker
+    
+    @property
+    def vector_store(self):
+        """Live vector store (raw faiss index or LangChain Chroma)."""
+        return self._live.vector_store
+    
+    @property
+    def chunk_store(self) -> Optional[ChunkStore]:
+        """Live chunk store (FAISS only)."""
+        return self._live.chunk_store
+    
+    @property
+    def lexical_index(self) -> Optional[LexicalIndex]:
+        """Keyword index for live search, if it has been built."""
+        return self._lexical_index
+    
+    @property
+    def version(self) -> Optional[str]:
+        """Snapshot version of the live index, if it was saved or loaded."""
+        return self._live.version
+    
+    def _store_path(self, name: str) -> Path:
+        """Directory holding the saved index with the given name."""
+        return VECTOR_STORE_DIR / f"{name}_{self.store_type.lower()}"
+    
+    @staticmethod
+    def _collection_name(name: str) -> str:
+        """Turn an index name into a valid Chroma collection name."""
+        # Chroma requires 3-63 characters of [A-Za-z0-9._-], alphanumeric at both ends
+        collection = re.sub(r"[^A-Za-z0-9._-]", "_", name).strip("._-")[:63].strip("._-")
+        return collection if len(collection) >= 3 else f"idx{collection}"
     
-    def create_vector_store(self, documents: List[Document]) -> None:
+    def _open_chroma(self, name: str, directory: Path) -> Chroma:
+        """Open (or create) the named collection persisted in a directory."""
+        return Chroma(
+            collection_name=self._collection_name(name),
+            embedding_function=self.embedding_engine.embeddings,
+            persist_directory=str(directory)
+        )
+    
+    @staticmethod
+    def _release_chroma(store: Chroma) -> None:
+        """
+        Stop the chromadb System behind a store and drop it from chromadb's cache.
+        
+        chromadb keeps one System per persist directory for the whole process,
+        so dropping the last reference to a store frees nothing by itself.
+        """
+        identifier = store._client._identifier
+        system = SharedSystemClient._identifier_to_system.pop(identifier, None)
+        # Newer chromadb versions also reference-count clients per System
+        getattr(SharedSystemClient, "_identifier_to_refcount", {}).pop(identifier, None)
+        if system is not None:
+            system.stop()
+    
+    @staticmethod
+    def _chroma_upsert(store: Chroma, ids, embeddings, documents, metadatas) -> None:
+        """Upsert precomputed vectors into a Chroma collection in bounded batches."""
+        for start in range(0, len(ids), CHROMA_BATCH_SIZE):
+            end = start + CHROMA_BATCH_SIZE
+            store._collection.upsert(
+                ids=ids[start:end],
+                embeddings=embeddings[start:end],
+                documents=documents[start:end],
+                metadatas=metadatas[start:end]
+            )
+    
+    def _create_chroma(
+        self,
+        documents: List[Document],
+        name: str,
+        vectors: Optional[np.ndarray] = None,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> Chroma:
+        """Build a fresh named Chroma collection, embedding one batch at a time unless vectors are given."""
+        directory = self._store_path(name) / "build"
+        store = self._open_chroma(name, directory)
+        # Start from an empty collection so a rebuild never mixes in old chunks
+        store.delete_collection()
+        store = self._open_chroma(name, directory)
+        
+        for start in range(0, len(documents), CHROMA_BATCH_SIZE):
+            batch = documents[start:start + CHROMA_BATCH_SIZE]
+            texts = [doc.page_content for doc in batch]
+            if vectors is None:
+                batch_vectors = self.embedding_engine.embed_documents_array(texts)
+            else:
+                batch_vectors = vectors[start:start + len(batch)]
+            self._chroma_upsert(
+                store,
+                ids=[str(chunk_id) for chunk_id in range(start, start + len(batch))],
+                embeddings=batch_vectors.tolist(),
+                documents=texts,
+                metadatas=[doc.metadata for doc in batch]
+            )
+            if progress is not None:
+                progress(start + len(batch), len(documents))
+        
+        logger.info(f"ChromaDB collection '{self._collection_name(name)}' written to {directory}")
+        return store
+    
+    def _copy_chroma(self, source: Chroma, name: str, directory: Path) -> None:
+        """Copy a Chroma collection, vectors included, into a new directory."""
+        target = self._open_chroma(name, directory)
+        
+        try:
+            collection = source._collection
+            total = collection.count()
+            for offset in range(0, total, CHROMA_BATCH_SIZE):
+                batch = collection.get(
+                    include=["embeddings", "documents", "metadatas"],
+                    limit=CHROMA_BATCH_SIZE,
+                    offset=offset
+                )
+                self._chroma_upsert(
+                    target,
+                    ids=batch["ids"],
+                    embeddings=batch["embeddings"],
+                    documents=batch["documents"],
+                    metadatas=batch["metadatas"]
+                )
+        finally:
+            # The directory is renamed when published; no client may keep using its old path
+            self._release_chroma(target)
+    
+    def create_vector_store(self, documents: List[Document], name: str = DEFAULT_INDEX_NAME) -> None:
         """
         Create vector store from documents.
         
         Args:
             documents: List of LangChain Document chunks
+            name: Index name; ChromaDB builds into this index's working collection
+        """
+        self.create_vector_store_from_embeddings(documents, None, name)
+    
+    def create_vector_store_from_embeddings(
+        self,
+        documents: Union[List[Document], ChunkStore],
+        vectors: Optional[np.ndarray],
+        name: str = DEFAULT_INDEX_NAME,
+        progress: Optional[Callable[[int, int], None]] = None
+    ) -> None:
+        """
+        Create vector store from documents and their precomputed embeddings.
+        
+        Lets one set of embeddings populate several store types without
+        running the model again.
+        
+        Args:
+            documents: List of LangChain Document chunks, or a ChunkStore
+            vectors: Float32 array of shape (len(documents), dimension) from this
+                manager's embedding model, or None to embed here (ChromaDB then
+                embeds batch by batch while writing)
+            name: Index name; ChromaDB builds into this index's working collection
+            progress: Called with (chunks written, total chunks) during ChromaDB writes
         """
         logger.info(f"Creating {self.store_type} vector store from {len(documents)} chunks")
         
+        if vectors is not None:
+            vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+            if vectors.shape != (len(documents), self.embedding_engine.dimension):
+                raise ValueError(
+                    f"Expected embeddings of shape ({len(documents)}, {self.embedding_engine.dimension}), "
+                    f"got {vectors.shape}"
+                )
+        
         if self.store_type == "FAISS":
-            self.vector_store = FAISS.from_documents(
-                documents=documents,
-                embedding=self.embedding_engine.embeddings
-            )
+            chunk_store = documents if isinstance(documents, ChunkStore) else ChunkStore.from_documents(documents)
+            if vectors is None:
+                vectors = self.embedding_engine.embed_documents_array(
+                    [chunk_store.get_text(i) for i in range(len(chunk_store))]
+                )
+            index = faiss.IndexFlatL2(self.embedding_engine.dimension)
+            index.add(vectors)
+            self._live = self._faiss_live(index, chunk_store)
         elif self.store_type == "ChromaDB":
-            self.vector_store = Chroma.from_documents(
-                documents=documents,
-                embedding=self.embedding_engine.embeddings,
-                persist_directory=str(VECTOR_STORE_DIR / "chroma_db")
-            )
+            if isinstance(documents, ChunkStore):
+                # Result views read text and metadata from the store batch by batch
+                documents = [documents.result(i) for i in range(len(documents))]
+            self._live = LiveIndex(self._create_chroma(documents, name, vectors, progress))
         else:
             raise ValueError(f"Unsupported vector store: {self.store_type}")
         
+        self.index_name = name
+        self._reset_derived_state()
         logger.info(f"{self.store_type} vector store created successfully")
     
-    def save_vector_store(self, name: str) -> None:
+    def current_version(self, name: str) -> Optional[str]:
+        """
+        Read the published snapshot version of a saved index.
+        
+        Args:
+            name: Name of the saved store
+            
+        Returns:
+            Version string, or None if the index has no versioned snapshots
+        """
+        try:
+            version = (self._store_path(name) / self.CURRENT_FILE).read_text(encoding='utf-8').strip()
+        except FileNotFoundError:
+            return None
+        return version or None
+    
+    def _chunk_count(self, live: LiveIndex) -> int:
+        """Number of chunks in a live index."""
+        if self.store_type == "FAISS":
+            return live.vector_store.ntotal
+        return live.vector_store._collection.count()
+    
+    def save_vector_store(self, name: str) -> str:
         """
-        Save vector store to disk.
+        Save vector store to disk as a new snapshot version.
+        
+        The snapshot is written to a temporary directory, renamed into
+        versions/, and only then published by atomically replacing the
+        CURRENT pointer, so readers never see a partially written index.
         
         Args:
             name: Name for the saved store
+            
+        Returns:
+            Version string of the published snapshot
         """
-        if self.vector_store is None:
+        live = self._live
+        if live.vector_store is None:
             raise ValueError("No vector store to save")
         
-        save_path = VECTOR_STORE_DIR / f"{name}_{self.store_type.lower()}"
+        index_dir = self._store_path(name)
+        versions_dir = index_dir / "versions"
+        versions_dir.mkdir(parents=True, exist_ok=True)
+        staging = versions_dir / f".tmp-{uuid.uuid4().hex}"
+        
+        try:
+            if self.store_type == "FAISS":
+                staging.mkdir()
+                faiss.write_index(live.vector_store, str(staging / "index.faiss"))
+                live.chunk_store.save(staging)
+            elif self.store_type == "ChromaDB":
+                self._copy_chroma(live.vector_store, name, staging)
+            
+            manifest = {
+                "name": name,
+                "store_type": self.store_type,
+                "model_key": self.embedding_engine.model_key,
+                "dimension": self.embedding_engine.dimension,
+                "chunk_count": self._chunk_count(live),
+                "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z")
+            }
+            with open(staging / self.MANIFEST_FILE, 'w', encoding='utf-8') as f:
+                json.dump(manifest, f, indent=2)
+            
+            version = self._publish_snapshot(index_dir, staging)
+        except Exception:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        
+        self._prune_versions(index_dir, keep=version)
+        
+        # The in-memory index now matches the published snapshot
+        if name == self.index_name and self._live is live:
+            if self.store_type == "ChromaDB":
+                self._serve_chroma_snapshot(live, name, version)
+            else:
+                self._live = live.at_version(version)
+        
+        logger.info(f"{self.store_type} store saved to {versions_dir / version}")
+        return version
+    
+    def _serve_chroma_snapshot(self, live: LiveIndex, name: str, version: str) -> None:
+        """
+        Switch a ChromaDB index over to its published snapshot.
+        
+        The collection that was saved (the build/ directory, or an older
+        snapshot that may since have been pruned) is released, and build/ is
+        deleted, so each index is kept on disk only in its snapshots.
+        """
+        self._live = LiveIndex(self._open_chroma(name, self._store_path(name) / "versions" / version), None, version)
+        self._release_chroma(live.vector_store)
+        shutil.rmtree(self._store_path(name) / "build", ignore_errors=True)
+    
+    def _publish_snapshot(self, index_dir: Path, staging: Path) -> str:
+        """Move a finished snapshot into place and point CURRENT at it."""
+        versions_dir = index_dir / "versions"
+        
+        while True:
+            numbers = [
+                int(path.name[1:]) for path in versions_dir.glob("v*") if path.name[1:].isdigit()
+            ]
+            version = f"v{max(numbers, default=0) + 1:06d}"
+            try:
+                os.rename(staging, versions_dir / version)
+                break
+            except OSError:
+                # Another writer claimed this version number first
+                if not (versions_dir / version).exists():
+                    raise
+        
+        pointer_tmp = index_dir / f".{self.CURRENT_FILE}.{uuid.uuid4().hex}"
+        with open(pointer_tmp, 'w', encoding='utf-8') as f:
+            f.write(version)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(pointer_tmp, index_dir / self.CURRENT_FILE)
+        return version
+    
+    def _prune_versions(self, index_dir: Path, keep: str) -> None:
+        """Delete all but the newest INDEX_VERSIONS_KEPT snapshots."""
+        versions = sorted(
+            path for path in (index_dir / "versions").glob("v*") if path.name[1:].isdigit()
+        )
+        for path in versions[:-INDEX_VERSIONS_KEPT]:
+            if path.name != keep:
+                shutil.rmtree(path, ignore_errors=True)
+    
+    def _check_manifest(self, path: Path) -> None:
+        """
+        Refuse a snapshot built with a different embedding model than this manager's.
+        
+        Raises:
+            ValueError: If the manifest's model_key or dimension differs from the engine
+        """
+        manifest_path = path / self.MANIFEST_FILE
+        if not manifest_path.exists():
+            # Snapshots from earlier versions carry no manifest
+            return
+        
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        expected = (self.embedding_engine.model_key, self.embedding_engine.dimension)
+        found = (manifest.get('model_key'), manifest.get('dimension'))
+        if found != expected:
+            message = (
+                f"Snapshot {path} was built with {found[0]} ({found[1]}-d), "
+                f"but this manager embeds queries with {expected[0]} ({expected[1]}-d)"
+            )
+            logger.error(message)
+            raise ValueError(message)
+    
+    def _read_snapshot(self, name: str, path: Path) -> LiveIndex:
+        """Load the vector store (and chunk store) saved in a directory."""
+        self._check_manifest(path)
         
         if self.store_type == "FAISS":
-            self.vector_store.save_local(str(save_path))
-            logger.info(f"FAISS store saved to {save_path}")
-        elif self.store_type == "ChromaDB":
-            # ChromaDB persists automatically if persist_directory is set
-            logger.info(f"ChromaDB persisted to {VECTOR_STORE_DIR / 'chroma_db'}")
+            if ChunkStore.exists(path):
+                return self._faiss_live(faiss.read_index(str(path / "index.faiss")), ChunkStore.load(path))
+            
+            # Index saved by LangChain's FAISS wrapper (index.faiss + index.pkl)
+            legacy_store = FAISS.load_local(
+                str(path),
+                self.embedding_engine.embeddings,
+                allow_dangerous_deserialization=True
+            )
+            return self._faiss_live(legacy_store.index, self._chunk_store_from_langchain(legacy_store))
+        
+        if self.store_type == "ChromaDB":
+            # Only a directory holding a Chroma database is a snapshot; the index
+            # root of a built but never saved index holds just build/
+            if (path / CHROMA_DB_FILE).exists():
+                return LiveIndex(self._open_chroma(name, path))
+            
+            # Single shared collection written by earlier versions
+            legacy_path = VECTOR_STORE_DIR / "chroma_db"
+            if not legacy_path.exists():
+                raise FileNotFoundError(f"No ChromaDB index named '{name}'")
+            return LiveIndex(Chroma(
+                persist_directory=str(legacy_path),
+                embedding_function=self.embedding_engine.embeddings
+            ))
+        
+        raise ValueError(f"Unsupported vector store: {self.store_type}")
     
     def load_vector_store(self, name: str) -> bool:
         """
         Load vector store from disk.
         
+        Loads the snapshot CURRENT points to, or the unversioned layout
+        written by earlier versions.
+        
         Args:
             name: Name of the saved store
             
         Returns:
             True if loaded successfully, False otherwise
         """
-        load_path = VECTOR_STORE_DIR / f"{name}_{self.store_type.lower()}"
+        version = self.current_version(name)
+        load_path = self._store_path(name)
+        if version is not None:
+            load_path = load_path / "versions" / version
         
         try:
-            if self.store_type == "FAISS":
-                self.vector_store = FAISS.load_local(
-                    str(load_path),
-                    self.embedding_engine.embeddings,
-                    allow_dangerous_deserialization=True
-                )
-                logger.info(f"FAISS store loaded from {load_path}")
-                return True
-            elif self.store_type == "ChromaDB":
-                self.vector_store = Chroma(
-                    persist_directory=str(VECTOR_STORE_DIR / "chroma_db"),
-                    embedding_function=self.embedding_engine.embeddings
-                )
-                logger.info(f"ChromaDB loaded from {VECTOR_STORE_DIR / 'chroma_db'}")
-                return True
+            live = self._read_snapshot(name, load_path)
         except Exception as e:
             logger.error(f"Error loading vector store: {e}")
             return False
         
-        return False
+        self._live = live.at_version(version)
+        self.index_name = name
+        self._reset_derived_state()
+        logger.info(f"{self.store_type} store loaded from {load_path}")
+        return True
+    
+    def reload(self) -> bool:
+        """
+        Swap in the latest published snapshot of the current index.
+        
+        The new snapshot is loaded alongside the live one and then swapped in
+        with a single reference assignment; searches already running finish
+        against the index they started with.
+        
+        Returns:
+            True if a newer snapshot was loaded, False if already current
+            
+        Raises:
+            ValueError: If the new snapshot was built with a different embedding
+                model; the live index is kept
+        """
+        if self.index_name is None:
+            raise ValueError("No saved index to reload")
+        
+        with self._reload_lock:
+            version = self.current_version(self.index_name)
+            if version is None or version == self._live.version:
+                return False
+            
+            live = self._read_snapshot(self.index_name, self._store_path(self.index_name) / "versions" / version)
+            self._live = live.at_version(version)
+        
+        self._reset_derived_state()
+        logger.info(f"Reloaded index '{self.index_name}' at version {version}")
+        return True
+    
+    def watch_for_updates(self, interval_seconds: float = 30.0) -> threading.Event:
+        """
+        Poll for newly published snapshots in a background thread.
+        
+        Args:
+            interval_seconds: Time between checks of the CURRENT pointer
+            
+        Returns:
+            Event that stops the watcher when set
+        """
+        stop = threading.Event()
+        
+        def watch():
+            while not stop.wait(interval_seconds):
+                try:
+                    self.reload()
+                except Exception as e:
+                    logger.error(f"Index reload failed: {e}")
+        
+        threading.Thread(target=watch, daemon=True, name="index-reload").start()
+        return stop
+    
+    @staticmethod
+    def _chunk_store_from_langchain(store: FAISS) -> ChunkStore:
+        """Convert the docstore of a LangChain FAISS store into a ChunkStore."""
+        chunk_store = ChunkStore()
+        for position in range(store.index.ntotal):
+            doc = store.docstore.search(store.index_to_docstore_id[position])
+            chunk_store.add(doc.page_content, doc.metadata)
+        return chunk_store
+    
+    def close(self) -> None:
+        """
+        Release the live index and everything derived from it.
+        
+        The manager holds no index afterwards. ChromaDB stores are also
+        released from chromadb's process-wide client cache.
+        """
+        with self._reload_lock:
+            live = self._live
+            self._live = LiveIndex()
+            self.index_name = None
+        self._reset_derived_state()
+        
+        if self.store_type == "ChromaDB" and live.vector_store is not None:
+            self._release_chroma(live.vector_store)
+    
+    def _reset_derived_state(self) -> None:
+        """Drop indexes and caches derived from the previous vector store."""
+        self._lexical_index = None
+        if self.reranker is not None:
+            self.reranker.clear_cache()
     
-    def similarity_search(self, query: str, k: int = 5) -> List[Tuple[Document, float]]:
+    def similarity_search(
+        self,
+        query: str,
+        k: int = 5,
+        rerank: bool = False,
+        mmr: bool = False,
+        fetch_k: int = MMR_FETCH_K,
+        lambda_mult: float = MMR_LAMBDA,
+        max_per_source: Optional[int] = None,
+        top_files: Optional[int] = None
+    ) -> List[Tuple[Document, float]]:
         """
         Perform similarity search on vector store.
         
         Args:
             query: Search query
             k: Number of top results to return
+            rerank: Rescore a larger candidate pool with the cross-encoder reranker
+            mmr: Diversify results by maximal marginal relevance over fetch_k
+                candidates; with rerank, the diversified pool is what gets rescored
+            fetch_k: Number of candidates MMR chooses from
+            lambda_mult: MMR trade-off, 1.0 for relevance only, 0.0 for diversity only
+            max_per_source: Maximum MMR results from one source file (None for no cap)
+            top_files: Route the query through the document-level index and only
+                search chunks of this many best-matching files (FAISS only;
+                None searches every chunk)
             
         Returns:
-            List of (Document, similarity_score) tuples
+            List of (Document, similarity_score) tuples. FAISS results are
+            ChunkResult views exposing the same page_content and metadata.
+            Vector scores are distances (lower is better); reranked scores are
+            cross-encoder relevance (higher is better).
         """
-        if self.vector_store is None:
+        # Read the live index once so a concurrent reload cannot mix snapshots
+        live = self._live
+        if live.vector_store is None:
             raise ValueError("No vector store loaded")
         
-        # Perform search with scores
-        results = self.vector_store.similarity_search_with_score(query, k=k)
+        if rerank and self.reranker is None:
+            self.reranker = Reranker()
+        pool = self.reranker.pool_size(k) if rerank else k
+        
+        if mmr:
+            candidates = self._mmr_search(
+                live, query, pool, max(fetch_k, pool), lambda_mult, max_per_source, top_files
+            )
+        else:
+            candidates = self._vector_search(live, query, pool, top_files)
+        results = self.reranker.rerank(query, candidates, k) if rerank else candidates
         
         logger.info(f"Found {len(results)} results for query: {query[:50]}...")
         return results
+    
+    def _vector_search(
+        self,
+        live: LiveIndex,
+        query: str,
+        k: int,
+        top_files: Optional[int] = None
+    ) -> List[Tuple[Document, float]]:
+        """Perform first-stage search with scores."""
+        if self.store_type == "FAISS":
+            return self._faiss_search(live, query, k, top_files)
+        
+        # ChromaDB's HNSW index already avoids scanning every chunk, so top_files is ignored
+        
+        # Search by vector so cached query embeddings are reused
+        return live.vector_store.similarity_search_by_vector_with_relevance_scores(
+            self.embedding_engine.embed_query(query), k=k
+        )
+    
+    def _mmr_search(
+        self,
+        live: LiveIndex,
+        query: str,
+        k: int,
+        fetch_k: int,
+        lambda_mult: float,
+        max_per_source: Optional[int],
+        top_files: Optional[int] = None
+    ) -> List[Tuple[Document, float]]:
+        """Fetch candidates with their stored vectors and keep an MMR-diverse k."""
+        query_vector = np.asarray(self.embedding_engine.embed_query(query), dtype=np.float32)
+        
+        if self.store_type == "FAISS":
+            candidates = self._faiss_search(live, query, fetch_k, top_files)
+            ids = np.asarray([doc.chunk_id for doc, _ in candidates], dtype=np.int64)
+            # Vectors come straight from the index; nothing is re-embedded
+            vectors = live.vector_store.reconstruct_batch(ids) if len(ids) else np.empty((0, query_vector.size))
+            sources = np.asarray([live.chunk_store.file_id(int(i)) for i in ids], dtype=np.int64)
+        else:
+            store = live.vector_store
+            found = store._collection.query(
+                query_embeddings=[query_vector.tolist()],
+                n_results=fetch_k,
+                include=["embeddings", "documents", "metadatas", "distances"]
+            )
+            # Raw distances, matching the non-MMR path (lower is better)
+            candidates = [
+                (Document(page_content=text, metadata=metadata or {}), float(distance))
+                for text, metadata, distance in zip(
+                    found["documents"][0], found["metadatas"][0], found["distances"][0]
+                )
+            ]
+            vectors = np.asarray(found["embeddings"][0], dtype=np.float32).reshape(len(candidates), -1)
+            source_ids: Dict[str, int] = {}
+            sources = np.asarray(
+                [source_ids.setdefault(doc.metadata.get('source', ''), len(source_ids)) for doc, _ in candidates],
+                dtype=np.int64
+            )
+        
+        selected = mmr_select(query_vector, vectors, k, lambda_mult, sources, max_per_source)
+        return [candidates[i] for i in selected]
+    
+    def build_lexical_index(self) -> Optional[LexicalIndex]:
+        """
+        Build (once) the keyword index used for instant live-search hits.
+        
+        Returns:
+            LexicalIndex, or None for stores without a ChunkStore (ChromaDB)
+        """
+        chunk_store = self._live.chunk_store
+        if chunk_store is None:
+            return None
+        
+        with self._lexical_lock:
+            if self._lexical_index is None or self._lexical_index.chunk_store is not chunk_store:
+                self._lexical_index = LexicalIndex(chunk_store)
+                logger.info(f"Lexical index built over {len(chunk_store)} chunks")
+            return self._lexical_index
+    
+    def build_document_index(self) -> Optional[DocumentIndex]:
+        """
+        Return the per-file centroid index used to route searches.
+        
+        FAISS stores build it when they are created or loaded.
+        
+        Returns:
+            DocumentIndex, or None for stores without a ChunkStore (ChromaDB)
+        """
+        return self._live.document_index
+    
+    @staticmethod
+    def _faiss_live(index: faiss.Index, chunk_store: ChunkStore) -> LiveIndex:
+        """
+        Bundle a FAISS index with its chunk store and document index.
+        
+        The document index is built before the bundle is swapped in, so no
+        search waits for it and a reloaded index serves with it from the start.
+        """
+        document_index = DocumentIndex(index, chunk_store)
+        logger.info(
+            f"Document index built over {document_index.num_files} files "
+            f"and {index.ntotal} chunks"
+        )
+        return LiveIndex(index, chunk_store, document_index=document_index)
+    
+    def lexical_search(self, query: str, k: int = 5) -> List[Tuple[Document, float]]:
+        """
+        Perform keyword search over stored chunks.
+        
+        Args:
+            query: Search query; an unfinished last word is matched as a prefix
+            k: Number of top results to return
+            
+        Returns:
+            List of (Document, keyword_score) tuples (higher is better);
+            empty for stores without a ChunkStore
+        """
+        lexical_index = self.build_lexical_index()
+        if lexical_index is None:
+            return []
+        return lexical_index.search(query, k)
+    
+    def batch_search(self, queries: List[str], k: int = 5) -> List[List[Tuple[Document, float]]]:
+        """
+        Perform similarity search for several queries at once.
+        
+        For FAISS the queries are embedded in one model call and searched in
+        one index call.
+        
+        Args:
+            queries: Search queries
+            k: Number of top results to return per query
+            
+        Returns:
+            One list of (Document, similarity_score) tuples per query
+        """
+        live = self._live
+        if live.vector_store is None:
+            raise ValueError("No vector store loaded")
+        
+        if not queries:
+            return []
+        
+        if self.store_type == "FAISS":
+            results = self._faiss_search_vectors(live, self.embedding_engine.embed_queries(queries), k)
+        else:
+            results = [
+                live.vector_store.similarity_search_by_vector_with_relevance_scores(vector.tolist(), k=k)
+                for vector in self.embedding_engine.embed_queries(queries)
+            ]
+        
+        logger.info(f"Batch search completed for {len(queries)} queries")
+        return results
+    
+    def _faiss_search(
+        self,
+        live: LiveIndex,
+        query: str,
+        k: int,
+        top_files: Optional[int] = None
+    ) -> List[Tuple[Document, float]]:
+        """Search the raw FAISS index and materialize only the top-k hits."""
+        query_vector = np.asarray([self.embedding_engine.embed_query(query)], dtype=np.float32)
+        if top_files is None:
+            return self._faiss_search_vectors(live, query_vector, k)[0]
+        
+        chunk_ids, distances = live.document_index.search(query_vector[0], k, top_files)
+        return [
+            (live.chunk_store.result(int(chunk_id)), float(distance))
+            for chunk_id, distance in zip(chunk_ids, distances)
+        ]
+    
+    def _faiss_search_vectors(
+        self,
+        live: LiveIndex,
+        query_vectors: np.ndarray,
+        k: int
+    ) -> List[List[Tuple[Document, float]]]:
+        """Search the raw FAISS index with a matrix of query vectors."""
+        k = min(k, live.vector_store.ntotal)
+        if k <= 0:
+            return [[] for _ in range(len(query_vectors))]
+        
+        distances, ids = live.vector_store.search(query_vectors, k)
+        return [
+            [
+                (live.chunk_store.result(int(chunk_id)), float(distance))
+                for distance, chunk_id in zip(row_distances, row_ids)
+                if chunk_id != -1
+            ]
+            for row_distances, row_ids in zip(distances, ids)
+        ]
+    
+    # Columnar export
+    
+    def export_embeddings(self, path: Optional[Path] = None) -> Path:
+        """
+        Export chunk text, metadata and vectors of the live index.
+        
+        Args:
+            path: Output file; .parquet/.pq writes Parquet, .arrow and other
+                suffixes an Arrow IPC file (defaults to EXPORT_DIR/<index>.parquet)
+            
+        Returns:
+            Path of the written file
+        """
+        live = self._live
+        if live.vector_store is None:
+            raise ValueError("No vector store loaded")
+        
+        path = Path(path) if path else EXPORT_DIR / f"{self.index_name or DEFAULT_INDEX_NAME}.parquet"
+        write_embeddings(
+            path,
+            self._export_batches(live),
+            self.embedding_engine.model_key,
+            self.embedding_engine.dimension
+        )
+        return path
+    
+    def _export_batches(self, live: LiveIndex):
+        """Yield (texts, metadatas, vectors) batches of a live index in chunk order."""
+        if self.store_type == "FAISS":
+            chunk_store = live.chunk_store
+            vectors = stored_vectors(live.vector_store)
+            for start in range(0, len(chunk_store), EXPORT_BATCH_SIZE):
+                chunk_ids = range(start, min(start + EXPORT_BATCH_SIZE, len(chunk_store)))
+                yield (
+                    [chunk_store.get_text(i) for i in chunk_ids],
+                    [chunk_store.get_metadata(i) for i in chunk_ids],
+                    vectors[chunk_ids.start:chunk_ids.stop]
+                )
+            return
+        
+        collection = live.vector_store._collection
+        for offset in range(0, collection.count(), CHROMA_BATCH_SIZE):
+            batch = collection.get(
+                include=["embeddings", "documents", "metadatas"],
+                limit=CHROMA_BATCH_SIZE,
+                offset=offset
+            )
+            yield (
+                batch["documents"],
+                [metadata or {} for metadata in batch["metadatas"]],
+                np.asarray(batch["embeddings"], dtype=np.float32)
+            )
+    
+    def create_vector_store_from_file(self, path: Path, name: Optional[str] = None) -> None:
+        """
+        Create vector store from an Arrow/Parquet export without re-embedding.
+        
+        Args:
+            path: File written by export_embeddings
+            name: Index name (defaults to the file name without suffix)
+            
+        Raises:
+            ValueError: If the file was embedded with a different model
+        """
+        embedding_file = EmbeddingFile(path)
+        if (embedding_file.model_key, embedding_file.dimension) != (
+            self.embedding_engine.model_key, self.embedding_engine.dimension
+        ):
+            raise ValueError(
+                f"{path} was embedded with {embedding_file.model_key}, "
+                f"but this index uses {self.embedding_engine.model_key}"
+            )
+        
+        self.create_vector_store_from_embeddings(
+            embedding_file.chunk_store(), embedding_file.vectors, name or Path(path).stem
+        )
+    
+    # Async API
+    
+    @property
+    def executor(self) -> Executor:
+        """Executor that runs blocking searches for the async API."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=SEARCH_WORKERS, thread_name_prefix="vector-search"
+            )
+        return self._executor
+    
+    async def asimilarity_search(
+        self,
+        query: str,
+        k: int = 5,
+        channel: Optional[str] = None,
+        rerank: bool = False,
+        **search_options
+    ) -> List[Tuple[Document, float]]:
+        """
+        Perform similarity search without blocking the event loop.
+        
+        Args:
+            query: Search query
+            k: Number of top results to return
+            channel: Optional name; starting a new search on the same channel
+                cancels the one still in flight (channels belong to one event loop)
+            rerank: Rescore a larger candidate pool with the cross-encoder reranker
+            **search_options: MMR options passed to similarity_search
+            
+        Returns:
+            List of (Document, similarity_score) tuples
+            
+        Raises:
+            asyncio.CancelledError: If superseded by a newer search on the channel
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(
+            self.executor, partial(self.similarity_search, query, k, rerank, **search_options)
+        )
+        
+        if channel is not None:
+            self.cancel_search(channel)
+            self._inflight[channel] = future
+        
+        try:
+            return await future
+        finally:
+            if channel is not None and self._inflight.get(channel) is future:
+                del self._inflight[channel]
+    
+    async def abatch_search(self, queries: List[str], k: int = 5) -> List[List[Tuple[Document, float]]]:
+        """
+        Perform batch similarity search without blocking the event loop.
+        
+        Args:
+            queries: Search queries
+            k: Number of top results to return per query
+            
+        Returns:
+            One list of (Document, similarity_score) tuples per query
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.batch_search, queries, k)
+    
+    async def astream_search(
+        self,
+        query: str,
+        k: int = 5,
+        rerank: bool = False,
+        **search_options
+    ) -> AsyncIterator[Tuple[str, List[Tuple[Document, float]]]]:
+        """
+        Stream progressively better results for a query.
+        
+        Yields ("lexical", results) as soon as keyword hits are available
+        (FAISS only), then ("dense", results) from similarity search.
+        
+        Args:
+            query: Search query
+            k: Number of top results to return per stage
+            rerank: Rescore the dense candidates with the cross-encoder reranker
+            **search_options: MMR options passed to similarity_search for the dense stage
+        """
+        loop = asyncio.get_running_loop()
+        if self.chunk_store is not None:
+            yield "lexical", await loop.run_in_executor(self.executor, self.lexical_search, query, k)
+        yield "dense", await loop.run_in_executor(
+            self.executor, partial(self.similarity_search, query, k, rerank, **search_options)
+        )
+    
+    def cancel_search(self, channel: str) -> bool:
+        """
+        Cancel the in-flight async search on a channel.
+        
+        Must be called from the event loop running the search. A search that
+        has already started in the executor runs to completion, but its result
+        is discarded.
+        
+        Returns:
+            True if a pending search was cancelled
+        """
+        future = self._inflight.pop(channel, None)
+        if future is None or future.done():
+            return False
+        return future.cancel()
+
+
+def default_index_name(
+    data_directory: Path,
+    embedding_model: str,
+    embedding_backend: str = DEFAULT_EMBEDDING_BACKEND
+) -> str:
+    """
+    Name an index after its dataset, embedding model and non-default backend.
+    
+    Builds of one dataset with different models must not share a saved index
+    or ChromaDB collection, since each would overwrite the other.
+    """
+    name = f"{Path(data_directory).name or DEFAULT_INDEX_NAME}_{embedding_model}"
+    if embedding_backend != DEFAULT_EMBEDDING_BACKEND:
+        name += f"_{embedding_backend}"
+    return name
 
 
 # Convenience function for quick setup
 def create_semantic_search_system(
     data_directory: Path,
     embedding_model: str,
-    vector_store_type: str
+    vector_store_type: str,
+    embedding_backend: str = DEFAULT_EMBEDDING_BACKEND,
+    index_name: Optional[str] = None
 ) -> Tuple[VectorStoreManager, Dict]:
     """
     Create complete semantic search system from directory.
@@ -332,6 +1546,8 @@ def create_semantic_search_system(
         data_directory: Path to directory with documents
         embedding_model: Embedding model key
         vector_store_type: Type of vector store
+        embedding_backend: Inference backend key from EMBEDDING_BACKENDS
+        index_name: Name of the index (defaults to default_index_name)
         
     Returns:
         Tuple of (VectorStoreManager, statistics)
@@ -347,11 +1563,42 @@ def create_semantic_search_system(
     chunks = processor.split_documents(documents)
     
     # Create embeddings
-    embedding_engine = EmbeddingEngine(embedding_model)
+    embedding_engine = EmbeddingEngine(embedding_model, embedding_backend)
     
     # Create and populate vector store
     vector_manager = VectorStoreManager(vector_store_type, embedding_engine)
-    vector_manager.create_vector_store(chunks)
+    vector_manager.create_vector_store(
+        chunks, index_name or default_index_name(data_directory, embedding_model, embedding_backend)
+    )
     
     stats['total_chunks'] = len(chunks)
     return vector_manager, stats
+
+
+def create_search_system_from_file(
+    embeddings_path: Path,
+    vector_store_type: str,
+    embedding_backend: str = DEFAULT_EMBEDDING_BACKEND,
+    index_name: Optional[str] = None
+) -> Tuple[VectorStoreManager, Dict]:
+    """
+    Create semantic search system from an Arrow/Parquet embeddings export.
+    
+    The embedding model recorded in the file is loaded only to embed queries.
+    
+    Args:
+        embeddings_path: File written by VectorStoreManager.export_embeddings
+        vector_store_type: Type of vector store
+        embedding_backend: Inference backend key from EMBEDDING_BACKENDS
+        index_name: Name of the index (defaults to the file name without suffix)
+        
+    Returns:
+        Tuple of (VectorStoreManager, statistics)
+    """
+    info = read_export_info(embeddings_path)
+    
+    embedding_engine = EmbeddingEngine(info['model_key'], embedding_backend)
+    vector_manager = VectorStoreManager(vector_store_type, embedding_engine)
+    vector_manager.create_vector_store_from_file(embeddings_path, index_name)
+    
+    return vector_manager, {'total_chunks': info['rows']}
@@ -0,0 +1,146 @@
+"""
+Live search benchmark for AI Research Assistant
+Times the two stages of search-as-you-type on a synthetic index: keyword
+search with prefix expansion of the word being typed, then the dense
+search, once per keystroke. Chunk text follows a Zipf word distribution
+and vectors are random, so no dataset or model is needed; the time to
+embed the query with a real model is not included.
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import LIVE_SEARCH_MIN_CHARS
+from app.chunk_store import ChunkStore
+from app.lexical import LexicalIndex
+from app.utils import VectorStoreManager
+from experiments.offline import StandInEngine
+
+
+def synthetic_corpus(num_chunks: int, words_per_chunk: int, vocabulary_size: int, num_files: int, seed: int = 0):
+    """
+    Generate chunk text with Zipf-distributed words and one random vector per chunk.
+
+    Returns:
+        Tuple of (ChunkStore, vocabulary ordered from most to least frequent)
+    """
+    rng = np.random.default_rng(seed)
+    letters = np.array(list("abcdefghijklmnopqrstuvwxyz"))
+    vocabulary = []
+    seen = set()
+    while len(vocabulary) < vocabulary_size:
+        word = "".join(rng.choice(letters, size=rng.integers(3, 11)))
+        if word not in seen:
+            seen.add(word)
+            vocabulary.append(word)
+
+    ranks = rng.zipf(1.3, size=(num_chunks, words_per_chunk)) - 1
+    ranks[ranks >= vocabulary_size] = rng.integers(0, vocabulary_size, size=int((ranks >= vocabulary_size).sum()))
+    words = np.array(vocabulary)
+
+    store = ChunkStore()
+    for chunk_id in range(num_chunks):
+        store.add(" ".join(words[ranks[chunk_id]]), {'source': f"file{chunk_id % num_files}.txt"})
+    return store, vocabulary
+
+
+def keystrokes(query: str) -> List[str]:
+    """Query text after each keystroke that live search would act on."""
+    return [query[:end] for end in range(LIVE_SEARCH_MIN_CHARS, len(query) + 1)]
+
+
+def summarize(name: str, seconds: List[float]) -> Dict:
+    """Median, 95th percentile and maximum latency in milliseconds."""
+    ms = np.sort(np.asarray(seconds) * 1000)
+    return {
+        'stage': name,
+        'median_ms': float(np.median(ms)),
+        'p95_ms': float(ms[min(len(ms) - 1, int(0.95 * len(ms)))]),
+        'max_ms': float(ms[-1])
+    }
+
+
+def run_benchmark(
+    num_chunks: int,
+    dimension: int,
+    queries: List[str],
+    k: int = 5,
+    words_per_chunk: int = 150,
+    vocabulary_size: int = 50000,
+    num_files: int = 2000
+) -> List[Dict]:
+    """
+    Build a synthetic index and time each live-search stage per keystroke.
+
+    Args:
+        num_chunks: Number of chunks in the index
+        dimension: Embedding dimension of the flat index
+        queries: Queries typed one character at a time
+        k: Results per stage
+        words_per_chunk: Words of text per chunk
+        vocabulary_size: Distinct words in the corpus
+        num_files: Source files the chunks are spread over
+
+    Returns:
+        Latency summary per stage
+    """
+    start = time.perf_counter()
+    chunk_store, _ = synthetic_corpus(num_chunks, words_per_chunk, vocabulary_size, num_files)
+    vectors = np.random.default_rng(1).standard_normal((num_chunks, dimension)).astype(np.float32)
+    manager = VectorStoreManager("FAISS", StandInEngine(dimension=dimension))
+    manager.create_vector_store_from_embeddings(chunk_store, vectors, "benchmark")
+    print(f"Built {num_chunks} chunks x {dimension}-d in {time.perf_counter() - start:.1f} s")
+
+    start = time.perf_counter()
+    lexical_index: LexicalIndex = manager.build_lexical_index()
+    print(f"Built lexical index ({len(lexical_index.vocabulary)} terms) in {time.perf_counter() - start:.1f} s")
+
+    lexical_times, dense_times, total_times = [], [], []
+    for query in queries:
+        for text in keystrokes(query):
+            start = time.perf_counter()
+            lexical_index.search(text, k)
+            lexical = time.perf_counter() - start
+
+            start = time.perf_counter()
+            manager.similarity_search(text, k)
+            dense = time.perf_counter() - start
+
+            lexical_times.append(lexical)
+            dense_times.append(dense)
+            total_times.append(lexical + dense)
+
+    print(f"Timed {len(total_times)} keystrokes over {len(queries)} queries")
+    return [
+        summarize("lexical", lexical_times),
+        summarize("dense", dense_times),
+        summarize("lexical + dense", total_times)
+    ]
+
+
+if __name__ == "__main__":
+    # Configuration
+    NUM_CHUNKS = 100000
+    DIMENSION = 384  # all-MiniLM-L6-v2
+    TARGET_MS = 50  # Per-keystroke latency goal for live search
+
+    _, vocabulary = synthetic_corpus(1, 1, 50000, 1)
+    # Mix of very common, mid-frequency and rare words, as typed queries would be
+    QUERIES = [
+        " ".join(vocabulary[rank] for rank in ranks)
+        for ranks in [(0, 1, 2), (5, 40, 300), (100, 2000, 20000), (3, 700), (12, 90, 4000, 30000)]
+    ]
+
+    results = run_benchmark(NUM_CHUNKS, DIMENSION, QUERIES)
+    print(f"\n{'Stage':<16}{'median ms':>12}{'p95 ms':>10}{'max ms':>10}")
+    for row in results:
+        print(f"{row['stage']:<16}{row['median_ms']:>12.1f}{row['p95_ms']:>10.1f}{row['max_ms']:>10.1f}")
+    within = results[-1]['p95_ms'] <= TARGET_MS
+    print(f"\np95 per keystroke {'within' if within else 'over'} the {TARGET_MS} ms target")
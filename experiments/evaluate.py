@@ -0,0 +1,299 @@
+"""
+Retrieval evaluation harness for AI Research Assistant
+Measures retrieval quality (recall@k, MRR, nDCG) against labeled queries,
+together with query latency, index build time and index size, for every
+model/store/backend configuration.
+"""
+
+import sys
+import csv
+import json
+import math
+import shutil
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils import EmbeddingEngine, create_semantic_search_system
+from app.catalog import _directory_size
+from app.config import VECTOR_STORE_DIR, DEFAULT_EMBEDDING_BACKEND
+
+
+# Metrics
+
+def unique_sources(sources: Sequence[str]) -> List[str]:
+    """Collapse a ranked list of chunk sources to a ranked list of documents."""
+    return list(dict.fromkeys(sources))
+
+
+def recall_at_k(ranked: Sequence[str], relevant: set, k: int) -> float:
+    """Fraction of relevant documents found in the top k."""
+    if not relevant:
+        return 0.0
+    return len(relevant.intersection(ranked[:k])) / len(relevant)
+
+
+def reciprocal_rank(ranked: Sequence[str], relevant: set) -> float:
+    """Inverse rank of the first relevant document, 0 if none is found."""
+    for rank, source in enumerate(ranked, 1):
+        if source in relevant:
+            return 1.0 / rank
+    return 0.0
+
+
+def ndcg_at_k(ranked: Sequence[str], relevant: set, k: int) -> float:
+    """Normalized discounted cumulative gain with binary relevance."""
+    dcg = sum(1.0 / math.log2(i + 2) for i, source in enumerate(ranked[:k]) if source in relevant)
+    ideal = sum(1.0 / math.log2(i + 2) for i in range(min(len(relevant), k)))
+    return dcg / ideal if ideal else 0.0
+
+
+def load_labeled_queries(path: Path) -> List[Dict]:
+    """
+    Load labeled queries.
+
+    The file is a JSON list of {"query": str, "relevant": [filename, ...]}.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        labeled = json.load(f)
+    for item in labeled:
+        if 'query' not in item or not item.get('relevant'):
+            raise ValueError(f"Labeled query needs 'query' and non-empty 'relevant': {item}")
+    return labeled
+
+
+def score_rankings(rankings: List[List[str]], labeled: List[Dict], cutoffs: Sequence[int]) -> Dict[str, float]:
+    """
+    Average retrieval metrics over all labeled queries.
+
+    Args:
+        rankings: Ranked chunk source filenames per query
+        labeled: Labeled queries in the same order
+        cutoffs: Values of k for recall@k and nDCG@k
+
+    Returns:
+        Dictionary of metric name to mean value
+    """
+    metrics = {f"recall@{k}": 0.0 for k in cutoffs}
+    metrics.update({f"ndcg@{k}": 0.0 for k in cutoffs})
+    metrics["mrr"] = 0.0
+
+    for sources, item in zip(rankings, labeled):
+        relevant = set(item['relevant'])
+        for k in cutoffs:
+            # Cut at k chunks, then judge the distinct documents among them
+            ranked = unique_sources(sources[:k])
+            metrics[f"recall@{k}"] += recall_at_k(ranked, relevant, k)
+            metrics[f"ndcg@{k}"] += ndcg_at_k(ranked, relevant, k)
+        metrics["mrr"] += reciprocal_rank(unique_sources(sources), relevant)
+
+    return {name: value / len(labeled) for name, value in metrics.items()}
+
+
+# Evaluation
+
+def evaluate_configuration(
+    data_path: Path,
+    labeled: List[Dict],
+    model_key: str,
+    store_type: str,
+    backend: str = DEFAULT_EMBEDDING_BACKEND,
+    rerank: bool = False,
+    cutoffs: Sequence[int] = (1, 3, 5, 10),
+    keep_index: bool = False
+) -> Dict:
+    """
+    Build one configuration and measure its quality, speed and size.
+
+    Args:
+        data_path: Dataset directory
+        labeled: Labeled queries
+        model_key: Embedding model key
+        store_type: Vector store type
+        backend: Embedding inference backend
+        rerank: Whether searches use the cross-encoder reranker
+        cutoffs: Values of k to evaluate
+        keep_index: Keep the saved index under Vector_Store after measuring
+
+    Returns:
+        Dictionary of configuration, metrics and timings
+    """
+    index_name = f"eval_{model_key}_{backend}"
+
+    # Load (or download) the model before timing; the build then finds it warm
+    # in the model pool, as every later configuration of this model would
+    EmbeddingEngine(model_key, backend)
+
+    start_time = time.time()
+    vector_manager, stats = create_semantic_search_system(
+        data_path, model_key, store_type, backend, index_name=index_name
+    )
+    build_time = time.time() - start_time
+
+    # Size of the published on-disk snapshot
+    version = vector_manager.save_vector_store(index_name)
+    index_dir = VECTOR_STORE_DIR / f"{index_name}_{store_type.lower()}"
+    index_size = _directory_size(index_dir / "versions" / version)
+
+    # Warm up caches and lazy model loads before timing
+    k = max(cutoffs)
+    vector_manager.similarity_search(labeled[0]['query'], k=k, rerank=rerank)
+
+    latencies = []
+    rankings = []
+    for item in labeled:
+        search_start = time.perf_counter()
+        results = vector_manager.similarity_search(item['query'], k=k, rerank=rerank)
+        latencies.append(time.perf_counter() - search_start)
+        rankings.append([
+            doc.metadata.get('filename', Path(doc.metadata.get('source', '')).name)
+            for doc, _ in results
+        ])
+
+    if not keep_index:
+        shutil.rmtree(index_dir, ignore_errors=True)
+
+    latencies.sort()
+    result = {
+        'model': model_key,
+        'store': store_type,
+        'backend': backend,
+        'rerank': rerank,
+        'chunks': stats['total_chunks'],
+        'build_time_s': build_time,
+        'index_size_mb': index_size / 1024 / 1024,
+        'mean_latency_ms': 1000 * sum(latencies) / len(latencies),
+        'p95_latency_ms': 1000 * latencies[min(len(latencies) - 1, int(0.95 * len(latencies)))]
+    }
+    result.update(score_rankings(rankings, labeled, cutoffs))
+    return result
+
+
+def write_csv(results: List[Dict], path: Path) -> None:
+    """Write evaluation results to a CSV file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fields = list(dict.fromkeys(field for result in results for field in result))
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(results)
+
+
+def plot_results(results: List[Dict], path: Path, quality_metric: str = "ndcg@5") -> bool:
+    """
+    Plot quality against query latency, build time and index size.
+
+    Returns:
+        False if matplotlib is not installed
+    """
+    try:
+        import matplotlib
+        matplotlib.use("Agg")
+        import matplotlib.pyplot as plt
+    except ImportError:
+        print("matplotlib not installed; skipping plots (pip install matplotlib)")
+        return False
+
+    axes_spec = [
+        ('mean_latency_ms', "Mean query latency (ms)"),
+        ('build_time_s', "Index build time (s)"),
+        ('index_size_mb', "Index size (MB)")
+    ]
+    fig, axes = plt.subplots(1, len(axes_spec), figsize=(6 * len(axes_spec), 5))
+
+    for ax, (x_field, x_label) in zip(axes, axes_spec):
+        for result in results:
+            label = f"{result['model']}/{result['store']}/{result['backend']}"
+            if result['rerank']:
+                label += "+rerank"
+            ax.scatter(result[x_field], result[quality_metric])
+            ax.annotate(label, (result[x_field], result[quality_metric]), fontsize=7,
+                        xytext=(3, 3), textcoords='offset points')
+        ax.set_xlabel(x_label)
+        ax.set_ylabel(quality_metric)
+        ax.grid(True, alpha=0.3)
+
+    fig.suptitle("Retrieval quality vs. cost")
+    fig.tight_layout()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fig.savefig(path, dpi=120)
+    plt.close(fig)
+    return True
+
+
+def run_evaluation(
+    data_dir: str,
+    labeled_path: str,
+    models: list,
+    stores: list,
+    backends: list = (DEFAULT_EMBEDDING_BACKEND,),
+    rerank_options: list = (False,),
+    output_dir: str = "results"
+) -> List[Dict]:
+    """
+    Evaluate every configuration and report metrics, CSV and plots.
+
+    Args:
+        data_dir: Path to test dataset
+        labeled_path: Path to labeled queries JSON
+        models: Embedding model keys to evaluate
+        stores: Vector store types to evaluate
+        backends: Embedding inference backends to evaluate
+        rerank_options: Whether to evaluate with and/or without reranking
+        output_dir: Directory for evaluation.csv and evaluation.png
+    """
+    data_path = Path(data_dir)
+    if not data_path.exists():
+        print(f"Error: Data directory {data_dir} does not exist")
+        return []
+
+    labeled = load_labeled_queries(Path(labeled_path))
+    print(f"Loaded {len(labeled)} labeled queries")
+
+    results = []
+    for model_key in models:
+        for store_type in stores:
+            for backend in backends:
+                for rerank in rerank_options:
+                    config_name = f"{model_key}_{store_type}_{backend}" + ("_rerank" if rerank else "")
+                    print(f"\nEvaluating {config_name}...")
+                    try:
+                        result = evaluate_configuration(
+                            data_path, labeled, model_key, store_type, backend, rerank
+                        )
+                    except Exception as e:
+                        print(f"✗ Error evaluating {config_name}: {e}")
+                        continue
+                    results.append(result)
+                    print(f"  recall@5={result['recall@5']:.3f}  mrr={result['mrr']:.3f}  "
+                          f"ndcg@5={result['ndcg@5']:.3f}  latency={result['mean_latency_ms']:.1f} ms  "
+                          f"build={result['build_time_s']:.1f} s  size={result['index_size_mb']:.2f} MB")
+
+    if results:
+        output_path = Path(output_dir)
+        write_csv(results, output_path / "evaluation.csv")
+        print(f"\nResults written to {output_path / 'evaluation.csv'}")
+        if plot_results(results, output_path / "evaluation.png"):
+            print(f"Plots written to {output_path / 'evaluation.png'}")
+
+    return results
+
+
+if __name__ == "__main__":
+    # Configuration
+    DATA_DIR = "../data/sample_dataset"  # Modify this to point to your test dataset
+    LABELED_QUERIES = "labeled_queries.json"  # Query -> relevant filenames
+
+    MODELS = [
+        "all-MiniLM-L6-v2",
+        "all-mpnet-base-v2",
+        "multi-qa-MiniLM-L6-cos-v1"
+    ]
+    STORES = ["FAISS", "ChromaDB"]
+    BACKENDS = ["torch"]  # Add "int8" / "onnx" to compare optimized inference
+    RERANK = [False]  # Add True to measure the cross-encoder stage
+
+    run_evaluation(DATA_DIR, LABELED_QUERIES, MODELS, STORES, BACKENDS, RERANK)
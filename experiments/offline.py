@@ -0,0 +1,96 @@
+"""
+Offline check helpers for AI Research Assistant
+Shared by the test_*.py check scripts in this directory: a stand-in
+embedding engine that needs no model download, a helper to point module
+settings at temporary directories, and a runner that executes every check
+in a script when it is run directly. The checks also run under pytest.
+"""
+
+import hashlib
+import sys
+from contextlib import contextmanager
+from typing import Dict, List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from app.config import DEFAULT_EMBEDDING_BACKEND
+
+# Dimension of stand-in embeddings; small so checks stay fast
+STANDIN_DIMENSION = 16
+
+
+def hash_vector(text: str, dimension: int = STANDIN_DIMENSION) -> np.ndarray:
+    """Deterministic unit vector derived from a text's hash."""
+    seed = int.from_bytes(hashlib.sha1(text.encode('utf-8')).digest()[:8], 'little')
+    vector = np.random.default_rng(seed).standard_normal(dimension).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+class HashEmbeddings(Embeddings):
+    """LangChain embeddings returning hash vectors, for stores that embed queries themselves."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [hash_vector(text).tolist() for text in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return hash_vector(text).tolist()
+
+
+class StandInEngine:
+    """Drop-in for EmbeddingEngine that embeds with hash vectors."""
+
+    def __init__(
+        self,
+        model_key: str = "stand-in",
+        backend: str = DEFAULT_EMBEDDING_BACKEND,
+        dimension: int = STANDIN_DIMENSION
+    ):
+        self.model_key = model_key
+        self.backend = backend
+        self.dimension = dimension
+        self.embeddings = HashEmbeddings()
+
+    def embed_documents_array(self, texts: List[str], batch_size: int = 0) -> np.ndarray:
+        if not texts:
+            return np.empty((0, self.dimension), np.float32)
+        return np.stack([hash_vector(text, self.dimension) for text in texts])
+
+    def embed_query(self, text: str) -> List[float]:
+        return hash_vector(text, self.dimension).tolist()
+
+    def embed_queries(self, texts: List[str]) -> np.ndarray:
+        return self.embed_documents_array(texts)
+
+
+@contextmanager
+def patched(module, **values):
+    """Temporarily replace module attributes, e.g. a storage directory or an engine class."""
+    originals = {name: getattr(module, name) for name in values}
+    for name, value in values.items():
+        setattr(module, name, value)
+    try:
+        yield
+    finally:
+        for name, value in originals.items():
+            setattr(module, name, value)
+
+
+def run_checks(namespace: Dict) -> None:
+    """
+    Run every test_* function of a check script and exit with its status.
+
+    Args:
+        namespace: The script's globals()
+    """
+    checks = [value for name, value in sorted(namespace.items()) if name.startswith("test_") and callable(value)]
+    failed = 0
+    for check in checks:
+        try:
+            check()
+            print(f"PASS  {check.__name__}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL  {check.__name__}: {e}")
+    print(f"\n{len(checks) - failed}/{len(checks)} checks passed")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,269 @@
+"""
+Experiment matrix runner for AI Research Assistant
+Runs every model/store configuration over one shared corpus: documents are
+loaded and chunked once, embedded once per model, and every store type is
+built from the same vectors. Independent configurations run concurrently
+within a CPU budget.
+"""
+
+import os
+import sys
+import time
+import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.utils import DocumentLoader, TextProcessor, EmbeddingEngine, VectorStoreManager
+from app.config import EMBEDDING_MODELS, DEFAULT_EMBEDDING_BACKEND, VECTOR_STORE_DIR
+from experiments.evaluate import load_labeled_queries, score_rankings, write_csv
+
+
+def configure_threads(cpu_budget: int, workers: int) -> int:
+    """
+    Split the CPU budget between concurrent configurations.
+
+    Torch and FAISS thread pools are process-wide, so each is capped at the
+    per-worker share to keep parallel jobs from oversubscribing the cores.
+
+    Returns:
+        Threads available to each worker
+    """
+    threads = max(1, cpu_budget // workers)
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+    try:
+        import faiss
+        faiss.omp_set_num_threads(threads)
+    except ImportError:
+        pass
+    return threads
+
+
+def embed_corpus(texts: List[str], model_key: str, backend: str):
+    """Embed all chunk texts with one model; returns (engine, vectors, seconds)."""
+    start_time = time.time()
+    engine = EmbeddingEngine(model_key, backend)
+    vectors = engine.embed_documents_array(texts)
+    return engine, vectors, time.time() - start_time
+
+
+def run_configuration(
+    chunks: list,
+    engine: EmbeddingEngine,
+    vectors: np.ndarray,
+    store_type: str,
+    queries: List[str],
+    k: int
+) -> Dict:
+    """
+    Build one store from precomputed vectors and time the test queries.
+
+    Returns:
+        Dictionary of build time, per-query timings and ranked source filenames
+    """
+    vector_manager = VectorStoreManager(store_type, engine)
+    index_name = f"matrix_{engine.model_key}"
+
+    start_time = time.time()
+    vector_manager.create_vector_store_from_embeddings(chunks, vectors, index_name)
+    build_time = time.time() - start_time
+
+    search_times = []
+    rankings = []
+    top_scores = []
+    for query in queries:
+        search_start = time.time()
+        search_results = vector_manager.similarity_search(query, k=k)
+        search_times.append(time.time() - search_start)
+        rankings.append([doc.metadata.get('filename', 'Unknown') for doc, _ in search_results])
+        top_scores.append(search_results[0][1] if search_results else None)
+
+    # ChromaDB builds on disk; drop the scratch collection
+    shutil.rmtree(VECTOR_STORE_DIR / f"{index_name}_{store_type.lower()}", ignore_errors=True)
+
+    return {
+        'model': engine.model_key,
+        'store': store_type,
+        'build_time': build_time,
+        'search_times': search_times,
+        'rankings': rankings,
+        'top_scores': top_scores
+    }
+
+
+def run_matrix(
+    data_dir: str,
+    models: list,
+    stores: list,
+    queries: List[str],
+    backend: str = DEFAULT_EMBEDDING_BACKEND,
+    k: int = 5,
+    cpu_budget: Optional[int] = None,
+    workers: int = 2,
+    labeled_path: Optional[str] = None,
+    output_path: Optional[str] = None
+) -> Dict[str, Dict]:
+    """
+    Run every model/store configuration over a shared corpus.
+
+    Args:
+        data_dir: Path to test dataset
+        models: Embedding model keys to test
+        stores: Vector store types to test
+        queries: Test queries (replaced by the labeled queries if given)
+        backend: Embedding inference backend
+        k: Number of results per query
+        cpu_budget: Cores the whole run may use (defaults to all cores)
+        workers: Configurations run concurrently
+        labeled_path: Optional labeled queries JSON for quality metrics
+        output_path: Optional CSV file for the summary
+
+    Returns:
+        Dictionary mapping configuration name to its results
+    """
+    data_path = Path(data_dir)
+    if not data_path.exists():
+        print(f"Error: Data directory {data_dir} does not exist")
+        return {}
+
+    labeled = load_labeled_queries(Path(labeled_path)) if labeled_path else None
+    if labeled:
+        queries = [item['query'] for item in labeled]
+
+    cpu_budget = cpu_budget or os.cpu_count() or 1
+    workers = max(1, min(workers, cpu_budget, len(models) * len(stores)))
+    threads = configure_threads(cpu_budget, workers)
+    print(f"CPU budget: {cpu_budget} cores, {workers} concurrent configurations x {threads} threads")
+
+    # Shared corpus: load and chunk once
+    start_time = time.time()
+    documents, stats = DocumentLoader.load_documents_from_directory(data_path)
+    if not documents:
+        print("Error: No documents loaded from directory")
+        return {}
+    chunks = TextProcessor().split_documents(documents)
+    texts = [chunk.page_content for chunk in chunks]
+    prepare_time = time.time() - start_time
+    print(f"Loaded {stats['loaded_files']} documents into {len(chunks)} chunks in {prepare_time:.2f}s\n")
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="matrix") as executor:
+        embed_futures = {
+            executor.submit(embed_corpus, texts, model_key, backend): model_key
+            for model_key in models
+        }
+
+        # Store builds for a model start as soon as its embeddings are ready
+        config_futures = {}
+        for future in as_completed(embed_futures):
+            model_key = embed_futures[future]
+            try:
+                engine, vectors, embed_time = future.result()
+            except Exception as e:
+                print(f"✗ Error embedding with {model_key}: {e}")
+                for store_type in stores:
+                    results[f"{model_key}_{store_type}"] = {'error': str(e)}
+                continue
+
+            print(f"✓ Embedded with {EMBEDDING_MODELS[model_key]['name']} in {embed_time:.2f}s")
+            for store_type in stores:
+                config_future = executor.submit(
+                    run_configuration, chunks, engine, vectors, store_type, queries, k
+                )
+                config_futures[config_future] = (model_key, store_type, embed_time)
+
+        for future in as_completed(config_futures):
+            model_key, store_type, embed_time = config_futures[future]
+            config_name = f"{model_key}_{store_type}"
+            try:
+                result = future.result()
+            except Exception as e:
+                print(f"✗ Error testing {config_name}: {e}")
+                results[config_name] = {'error': str(e)}
+                continue
+
+            result['embed_time'] = embed_time
+            if labeled:
+                result['metrics'] = score_rankings(result['rankings'], labeled, (1, 3, k))
+            results[config_name] = result
+            print(f"✓ {config_name} built in {result['build_time']:.2f}s")
+
+    total_time = time.time() - start_time
+
+    # Summary
+    print("\n" + "=" * 80)
+    print("MATRIX SUMMARY")
+    print("=" * 80)
+
+    rows = []
+    for config_name in sorted(results):
+        data = results[config_name]
+        if 'error' in data:
+            print(f"\n{config_name}: FAILED - {data['error']}")
+            continue
+
+        avg_search = sum(data['search_times']) / len(data['search_times'])
+        scores = [score for score in data['top_scores'] if score is not None]
+        avg_score = sum(scores) / len(scores) if scores else 0.0
+
+        print(f"\n{config_name}:")
+        print(f"  Embedding Time (shared per model): {data['embed_time']:.2f}s")
+        print(f"  Store Build Time: {data['build_time']:.2f}s")
+        print(f"  Average Search Time: {avg_search:.4f}s")
+        print(f"  Average Top Score: {avg_score:.4f}")
+        for name, value in data.get('metrics', {}).items():
+            print(f"  {name}: {value:.3f}")
+
+        row = {
+            'model': data['model'],
+            'store': data['store'],
+            'embed_time_s': data['embed_time'],
+            'build_time_s': data['build_time'],
+            'mean_search_ms': 1000 * avg_search,
+            'avg_top_score': avg_score
+        }
+        row.update(data.get('metrics', {}))
+        rows.append(row)
+
+    print(f"\nTotal time: {total_time:.2f}s (corpus prepared once in {prepare_time:.2f}s)")
+
+    if output_path and rows:
+        write_csv(rows, Path(output_path))
+        print(f"Results written to {output_path}")
+
+    return results
+
+
+if __name__ == "__main__":
+    # Configuration
+    DATA_DIR = "../data/sample_dataset"  # Modify this to point to your test dataset
+    LABELED_QUERIES = "labeled_queries.json"  # Set to None to use QUERIES without metrics
+
+    MODELS = list(EMBEDDING_MODELS)
+    STORES = ["FAISS", "ChromaDB"]
+    QUERIES = [
+        "What is machine learning?",
+        "Explain neural networks",
+        "What are the benefits of AI?"
+    ]
+
+    CPU_BUDGET = None  # Cores to use; None for all
+    WORKERS = 2  # Configurations run concurrently
+
+    print("Starting experiment matrix...")
+    print(f"Data Directory: {DATA_DIR}")
+    print(f"Models: {MODELS}")
+    print(f"Vector Stores: {STORES}")
+    print()
+
+    run_matrix(DATA_DIR, MODELS, STORES, QUERIES, cpu_budget=CPU_BUDGET, workers=WORKERS,
+               labeled_path=LABELED_QUERIES, output_path="results/matrix.csv")
@@ -0,0 +1,113 @@
+"""
+Index build checks for AI Research Assistant
+Cancels IndexBuilder runs during loading and embedding, resumes them, and
+compares the result with an uninterrupted build, using a stand-in engine.
+"""
+
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.build
+import app.utils
+from app.build import BuildCancelled, IndexBuilder
+from app.hierarchy import stored_vectors
+from experiments.offline import StandInEngine, patched, run_checks
+
+
+class CountingEngine(StandInEngine):
+    """Stand-in engine that records every text it embeds, across instances."""
+
+    embedded = []
+
+    def embed_documents_array(self, texts, batch_size=0):
+        CountingEngine.embedded.extend(texts)
+        return super().embed_documents_array(texts, batch_size)
+
+
+def _write_dataset(directory: Path, files: int = 6) -> None:
+    """Write text files of a few chunks each."""
+    directory.mkdir(parents=True)
+    for i in range(files):
+        paragraphs = [f"Document {i} paragraph {p}. " + f"word{i}x{p} " * 60 for p in range(4)]
+        (directory / f"doc{i}.txt").write_text("\n\n".join(paragraphs), encoding='utf-8')
+
+
+def _cancel_at(stage: str, done: int, cancel_event):
+    """Progress callback that requests cancellation once a stage reaches a count."""
+    def progress(reported_stage, reported_done, total, eta):
+        if reported_stage == stage and reported_done >= done:
+            cancel_event.set()
+    return progress
+
+
+def _builder(data: Path, root: Path, name: str, **kwargs) -> IndexBuilder:
+    """FAISS build of a dataset with its checkpoints under root."""
+    return IndexBuilder(
+        data, "all-MiniLM-L6-v2", "FAISS", index_name=name, checkpoint_root=root / "checkpoints", **kwargs
+    )
+
+
+def _cancelled_then_resumed(stage: str, done: int):
+    """Cancel a build at a point, resume it, and return it with an uninterrupted reference build."""
+    with tempfile.TemporaryDirectory() as tmp, \
+            patched(app.build, EmbeddingEngine=CountingEngine, BUILD_PROGRESS_INTERVAL=0, EMBED_BATCH_SIZE=4), \
+            patched(app.utils, VECTOR_STORE_DIR=Path(tmp) / "stores"):
+        root = Path(tmp)
+        data = root / "data"
+        _write_dataset(data)
+
+        reference, _ = _builder(data, root / "reference", "reference").run()
+        CountingEngine.embedded.clear()
+
+        cancel = threading.Event()
+        builder = _builder(data, root, "docs", progress=_cancel_at(stage, done, cancel), cancel_event=cancel)
+        try:
+            builder.run()
+            raise AssertionError("build was not cancelled")
+        except BuildCancelled:
+            pass
+        assert builder.has_checkpoint
+        embedded_before_resume = len(CountingEngine.embedded)
+
+        builder = _builder(data, root, "docs")
+        assert builder.has_checkpoint
+        manager, stats = builder.run()
+        assert not builder.has_checkpoint
+
+        return reference, manager, stats, embedded_before_resume
+
+
+def _assert_same_index(reference, manager):
+    """Check two FAISS managers hold the same chunks and vectors in the same order."""
+    assert len(manager.chunk_store) == len(reference.chunk_store)
+    for chunk_id in range(len(reference.chunk_store)):
+        assert manager.chunk_store.get_text(chunk_id) == reference.chunk_store.get_text(chunk_id)
+        assert manager.chunk_store.get_metadata(chunk_id) == reference.chunk_store.get_metadata(chunk_id)
+    assert np.array_equal(stored_vectors(manager.vector_store), stored_vectors(reference.vector_store))
+
+
+def test_resume_after_cancel_while_loading():
+    """A build cancelled between files resumes loading and matches an uninterrupted build."""
+    reference, manager, stats, embedded = _cancelled_then_resumed("load", 2)
+    _assert_same_index(reference, manager)
+    assert embedded == 0
+    assert stats['loaded_files'] == 6 and stats['total_chunks'] == len(reference.chunk_store)
+
+
+def test_resume_after_cancel_while_embedding():
+    """A build cancelled between batches embeds only the remaining chunks when resumed."""
+    reference, manager, stats, embedded = _cancelled_then_resumed("embed", 8)
+    _assert_same_index(reference, manager)
+    assert embedded == 8
+    assert len(CountingEngine.embedded) == len(reference.chunk_store)
+
+
+if __name__ == "__main__":
+    run_checks(globals())
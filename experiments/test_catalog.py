@@ -0,0 +1,115 @@
+"""
+Index catalog checks for AI Research Assistant
+Exercises listing, lazy loading, memory accounting and LRU eviction of
+saved indexes, with a stand-in engine.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from chromadb.api.client import SharedSystemClient
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.catalog
+import app.utils
+from app.catalog import IndexCatalog
+from app.utils import VectorStoreManager
+from experiments.offline import StandInEngine, patched, run_checks
+
+
+def _save(store_type: str, name: str, count: int = 30) -> None:
+    """Build and save an index of generated passages."""
+    manager = VectorStoreManager(store_type, StandInEngine())
+    manager.create_vector_store(
+        [Document(page_content=f"{name} passage {i}", metadata={'source': f"{name}{i % 3}.txt"}) for i in range(count)],
+        name
+    )
+    manager.save_vector_store(name)
+    manager.close()
+
+
+def _catalog(root: Path, memory_budget_mb: int = 1024) -> IndexCatalog:
+    return IndexCatalog(root=root, memory_budget_mb=memory_budget_mb)
+
+
+def test_lists_and_loads_lazily():
+    """Saved indexes are listed from their manifests and loaded on first use, once."""
+    with tempfile.TemporaryDirectory() as tmp, \
+            patched(app.utils, VECTOR_STORE_DIR=Path(tmp)), patched(app.catalog, EmbeddingEngine=StandInEngine):
+        _save("FAISS", "alpha")
+        _save("FAISS", "beta", count=12)
+        catalog = _catalog(Path(tmp))
+
+        listed = {info['name']: info for info in catalog.list_indexes()}
+        assert set(listed) == {"alpha", "beta"}
+        assert listed["beta"]['chunk_count'] == 12 and listed["beta"]['model_key'] == "stand-in"
+        assert not listed["alpha"]['loaded'] and catalog.loaded() == []
+
+        manager = catalog.get("alpha", "FAISS")
+        assert catalog.get("alpha", "FAISS") is manager
+        assert catalog.search("beta", "FAISS", "beta passage 3", k=1)[0][0].page_content == "beta passage 3"
+        # Both indexes use the same model and backend, so they share one engine
+        assert catalog.get("beta", "FAISS").embedding_engine is manager.embedding_engine
+
+
+def test_memory_counts_derived_indexes():
+    """A FAISS index's estimate grows once its lexical index is built."""
+    with tempfile.TemporaryDirectory() as tmp, \
+            patched(app.utils, VECTOR_STORE_DIR=Path(tmp)), patched(app.catalog, EmbeddingEngine=StandInEngine):
+        _save("FAISS", "alpha")
+        catalog = _catalog(Path(tmp))
+        manager = catalog.get("alpha", "FAISS")
+
+        before = catalog.memory_bytes
+        index = manager.vector_store
+        assert before == (
+            index.ntotal * index.d * 4 + manager.chunk_store.nbytes + manager.build_document_index().nbytes
+        )
+        manager.build_lexical_index()
+        assert catalog.memory_bytes == before + manager.lexical_index.nbytes
+
+
+def test_evicts_least_recently_used_and_closes_it():
+    """Over budget, the least recently used index is evicted and its ChromaDB client released."""
+    with tempfile.TemporaryDirectory() as tmp, \
+            patched(app.utils, VECTOR_STORE_DIR=Path(tmp)), patched(app.catalog, EmbeddingEngine=StandInEngine):
+        for name in ("alpha", "beta"):
+            _save("ChromaDB", name)
+        _save("FAISS", "gamma")
+        catalog = _catalog(Path(tmp))
+        alpha = catalog.get("alpha", "ChromaDB")
+        beta = catalog.get("beta", "ChromaDB")
+        catalog.get("alpha", "ChromaDB")
+
+        # Room for the two ChromaDB indexes only, so loading gamma evicts beta
+        catalog.memory_budget_bytes = catalog.memory_bytes
+        catalog.get("gamma", "FAISS")
+        assert catalog.loaded() == [("alpha", "ChromaDB"), ("gamma", "FAISS")]
+        assert beta.vector_store is None and alpha.vector_store is not None
+
+        cached = [identifier for identifier in SharedSystemClient._identifier_to_system if identifier.startswith(tmp)]
+        assert not any("beta_chromadb" in identifier for identifier in cached), cached
+
+        assert catalog.evict("alpha", "ChromaDB") and not catalog.evict("alpha", "ChromaDB")
+        assert alpha.vector_store is None
+        catalog.evict("gamma", "FAISS")
+        assert catalog.memory_bytes == 0 and catalog._engines == {}
+
+
+def test_added_chroma_build_is_sized_from_disk():
+    """An unsaved ChromaDB index added to the catalog counts its build directory."""
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        manager = VectorStoreManager("ChromaDB", StandInEngine())
+        manager.create_vector_store([Document(page_content=f"passage {i}", metadata={'source': "fresh.txt"}) for i in range(10)], "fresh")
+        catalog = _catalog(Path(tmp))
+        catalog.add(manager)
+        assert catalog.memory_bytes > 0
+        catalog.evict("fresh", "ChromaDB")
+
+
+if __name__ == "__main__":
+    run_checks(globals())
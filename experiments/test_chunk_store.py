@@ -0,0 +1,54 @@
+"""
+Chunk store checks for AI Research Assistant
+Exercises the incremental save and limited load that index build
+checkpoints rely on.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.chunk_store import ChunkStore
+from experiments.offline import run_checks
+
+
+def _add_chunks(store, start, count):
+    """Add chunks with multi-byte text, a few per file."""
+    for i in range(start, start + count):
+        store.add(f"chunk {i} — naïve résumé", {'source': f"file{i // 3}.txt"})
+
+
+def test_chunk_store_checkpoint_round_trip():
+    """save_from appends to a saved store, and load(limit) drops chunks saved past a checkpoint."""
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp) / "chunks"
+        store = ChunkStore()
+        _add_chunks(store, 0, 4)
+        store.save_from(directory, 0)
+        _add_chunks(store, 4, 5)
+        store.save_from(directory, 4)
+
+        loaded = ChunkStore.load(directory)
+        assert len(loaded) == 9 and loaded.num_files == store.num_files
+        for i in range(9):
+            assert loaded.get_text(i) == store.get_text(i)
+            assert loaded.get_metadata(i) == store.get_metadata(i)
+
+        # Resume from a checkpoint taken after 6 chunks: the 3 saved later are replaced
+        resumed = ChunkStore.load(directory, limit=6)
+        assert len(resumed) == 6
+        resumed.add("replacement", {'source': "other.txt"})
+        resumed.save_from(directory, 6)
+
+        reloaded = ChunkStore.load(directory)
+        assert len(reloaded) == 7
+        assert reloaded.get_text(5) == store.get_text(5)
+        assert reloaded.get_text(6) == "replacement"
+        assert reloaded.get_metadata(6) == {'source': "other.txt"}
+
+
+if __name__ == "__main__":
+    run_checks(globals())
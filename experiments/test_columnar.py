@@ -0,0 +1,89 @@
+"""
+Columnar export checks for AI Research Assistant
+Round-trips chunks and vectors through Arrow IPC and Parquet files between
+FAISS and ChromaDB stores, with a stand-in engine. Requires pyarrow.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.columnar
+import app.utils
+from app.columnar import EmbeddingFile, read_export_info
+from app.hierarchy import stored_vectors
+from app.utils import VectorStoreManager
+from experiments.offline import StandInEngine, patched, run_checks
+
+
+def _documents(count: int = 25):
+    """Chunks with multi-byte text and nested metadata."""
+    return [
+        Document(page_content=f"chunk {i} — résumé", metadata={'source': f"file{i % 4}.txt", 'page': i % 3})
+        for i in range(count)
+    ]
+
+
+def test_round_trip_through_both_formats():
+    """Exports in several batches read back as the same chunks, metadata and vectors."""
+    with tempfile.TemporaryDirectory() as tmp, \
+            patched(app.utils, VECTOR_STORE_DIR=Path(tmp), EXPORT_BATCH_SIZE=7), \
+            patched(app.columnar, EXPORT_BATCH_SIZE=7):
+        source = VectorStoreManager("FAISS", StandInEngine())
+        source.create_vector_store(_documents(), "docs")
+        expected = stored_vectors(source.vector_store)
+
+        for suffix in (".arrow", ".parquet"):
+            path = source.export_embeddings(Path(tmp) / f"docs{suffix}")
+            assert read_export_info(path) == {'model_key': "stand-in", 'dimension': 16, 'rows': 25}
+
+            embedding_file = EmbeddingFile(path)
+            assert np.array_equal(embedding_file.vectors, expected), suffix
+
+            target = VectorStoreManager("FAISS", StandInEngine())
+            target.create_vector_store_from_file(path)
+            assert target.index_name == "docs"
+            assert np.array_equal(stored_vectors(target.vector_store), expected), suffix
+            for chunk_id in range(25):
+                assert target.chunk_store.get_text(chunk_id) == source.chunk_store.get_text(chunk_id)
+                assert target.chunk_store.get_metadata(chunk_id) == source.chunk_store.get_metadata(chunk_id)
+
+
+def test_chroma_export_imports_into_faiss():
+    """An export of a ChromaDB store populates a FAISS store with the same vectors, in chunk order."""
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        chroma = VectorStoreManager("ChromaDB", StandInEngine())
+        chroma.create_vector_store(_documents(), "docs")
+        path = chroma.export_embeddings(Path(tmp) / "docs.parquet")
+        chroma.close()
+
+        faiss_manager = VectorStoreManager("FAISS", StandInEngine())
+        faiss_manager.create_vector_store_from_file(path, "copy")
+        reference = StandInEngine().embed_documents_array([doc.page_content for doc in _documents()])
+        assert np.allclose(stored_vectors(faiss_manager.vector_store), reference, atol=1e-6)
+
+
+def test_import_refuses_another_model():
+    """Vectors from a different model are rejected instead of mixed into an index."""
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        source = VectorStoreManager("FAISS", StandInEngine())
+        source.create_vector_store(_documents(), "docs")
+        path = source.export_embeddings(Path(tmp) / "docs.parquet")
+
+        other = VectorStoreManager("FAISS", StandInEngine(model_key="other-model"))
+        try:
+            other.create_vector_store_from_file(path)
+            raise AssertionError("import from another model was accepted")
+        except ValueError:
+            pass
+        assert other.vector_store is None
+
+
+if __name__ == "__main__":
+    run_checks(globals())
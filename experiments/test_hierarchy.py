@@ -0,0 +1,89 @@
+"""
+Hierarchical retrieval checks for AI Research Assistant
+Compares the per-file centroid index with exact search and checks that
+FAISS stores carry it from the moment they are built or loaded.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import faiss
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.hierarchy
+import app.utils
+from app.chunk_store import ChunkStore
+from app.hierarchy import DocumentIndex
+from app.utils import VectorStoreManager
+from experiments.offline import StandInEngine, patched, run_checks
+
+
+def test_document_index_matches_exact_search():
+    """Centroids are normalized per-file means, and searching every file is exact search."""
+    rng = np.random.default_rng(0)
+    store = ChunkStore()
+    file_of_chunk = rng.integers(0, 7, size=60)
+    for i, file_id in enumerate(file_of_chunk):
+        store.add(f"chunk {i}", {'source': f"file{file_id}.txt"})
+    vectors = rng.standard_normal((60, 8)).astype(np.float32)
+    index = faiss.IndexFlatL2(8)
+    index.add(vectors)
+
+    document_index = DocumentIndex(index, store)
+
+    file_ids = np.frombuffer(store.file_ids(), dtype=np.int32)
+    expected = np.stack([vectors[file_ids == f].mean(axis=0) for f in range(store.num_files)])
+    expected /= np.linalg.norm(expected, axis=1, keepdims=True)
+    centroids = document_index.file_index.reconstruct_n(0, store.num_files)
+    assert np.allclose(centroids, expected, atol=1e-5)
+
+    query = rng.standard_normal(8).astype(np.float32)
+    distances, chunk_ids = index.search(query.reshape(1, -1), 10)
+    found_ids, found_distances = document_index.search(query, 10, top_files=store.num_files)
+    assert list(found_ids) == list(chunk_ids[0])
+    assert np.allclose(found_distances, distances[0], rtol=1e-4)
+
+
+def test_document_index_summed_in_blocks():
+    """Centroids summed a block of files at a time match one pass over all chunks."""
+    rng = np.random.default_rng(1)
+    store = ChunkStore()
+    for i, file_id in enumerate(rng.integers(0, 40, size=500)):
+        store.add(f"chunk {i}", {'source': f"file{file_id}.txt"})
+    index = faiss.IndexFlatL2(8)
+    index.add(rng.standard_normal((500, 8)).astype(np.float32))
+
+    whole = DocumentIndex(index, store).file_index.reconstruct_n(0, store.num_files)
+    with patched(app.hierarchy, CENTROID_BLOCK=7):
+        blocked = DocumentIndex(index, store).file_index.reconstruct_n(0, store.num_files)
+    assert np.allclose(whole, blocked, atol=1e-5)
+
+
+def test_document_index_built_with_store():
+    """Built and loaded FAISS stores serve top_files searches without building anything lazily."""
+    documents = [
+        Document(page_content=f"passage {i} about topic {i % 5}", metadata={'source': f"file{i % 5}.txt"})
+        for i in range(40)
+    ]
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        manager = VectorStoreManager("FAISS", StandInEngine())
+        manager.create_vector_store(documents, "docs")
+        assert manager.build_document_index() is not None
+        manager.save_vector_store("docs")
+
+        loaded = VectorStoreManager("FAISS", StandInEngine())
+        assert loaded.load_vector_store("docs")
+        assert loaded.build_document_index().num_files == 5
+
+        exact = loaded.similarity_search("passage 3 about topic 3", k=5)
+        routed = loaded.similarity_search("passage 3 about topic 3", k=5, top_files=5)
+        assert [doc.page_content for doc, _ in routed] == [doc.page_content for doc, _ in exact]
+
+
+if __name__ == "__main__":
+    run_checks(globals())
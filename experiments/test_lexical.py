@@ -0,0 +1,91 @@
+"""
+Live search checks for AI Research Assistant
+Exercises keyword search with prefix expansion of an unfinished last word,
+and the staged results streamed while the user types.
+"""
+
+import asyncio
+import sys
+import tempfile
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.utils
+from app.chunk_store import ChunkStore
+from app.lexical import LexicalIndex
+from app.utils import VectorStoreManager
+from experiments.offline import StandInEngine, patched, run_checks
+
+TEXTS = [
+    "Neural networks learn representations",
+    "A neuron fires when its input is large",
+    "Networks of roads connect cities",
+    "Gradient descent trains neural networks",
+    "Cities grow along rivers"
+]
+
+
+def _index(max_prefix_terms: int = 50) -> LexicalIndex:
+    """Lexical index over TEXTS, one file per chunk."""
+    store = ChunkStore()
+    for i, text in enumerate(TEXTS):
+        store.add(text, {'source': f"file{i}.txt"})
+    return LexicalIndex(store, max_prefix_terms=max_prefix_terms)
+
+
+def _ids(results):
+    return [result.chunk_id for result, _ in results]
+
+
+def test_unfinished_word_is_a_prefix():
+    """The last word matches as a prefix until it is followed by whitespace."""
+    index = _index()
+    assert set(_ids(index.search("neur", k=10))) == {0, 1, 3}
+    assert _ids(index.search("neur ", k=10)) == []
+    assert set(_ids(index.search("neural ", k=10))) == {0, 3}
+
+
+def test_complete_terms_must_match_exactly():
+    """Earlier words match whole tokens only, and chunks matching more terms rank first."""
+    index = _index()
+    results = index.search("neural netw", k=10)
+    assert _ids(results)[:2] in ([0, 3], [3, 0])
+    assert set(_ids(results)) == {0, 2, 3}
+    assert results[0][1] > results[-1][1]
+
+    # One credit per query term, however many expansions of the prefix a chunk holds
+    scores = {result.chunk_id: score for result, score in index.search("n", k=10)}
+    assert abs(scores[0] - max(index.idf["neural"], index.idf["networks"])) < 1e-5
+
+
+def test_prefix_expansion_is_capped():
+    """A prefix expands to at most max_prefix_terms vocabulary terms, in sorted order."""
+    index = _index(max_prefix_terms=1)
+    assert index._expand_prefix("ne") == ["networks"]
+    assert set(_ids(index.search("ne", k=10))) == {0, 2, 3}
+
+
+def test_stream_yields_lexical_then_dense():
+    """Streamed search gives keyword hits first, then dense results with the search options applied."""
+    documents = [Document(page_content=text, metadata={'source': f"file{i % 2}.txt"}) for i, text in enumerate(TEXTS)]
+
+    async def collect(manager):
+        return [stage async for stage in manager.astream_search("neural netw", k=3, mmr=True, max_per_source=1)]
+
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        manager = VectorStoreManager("FAISS", StandInEngine())
+        manager.create_vector_store(documents, "docs")
+        stages = asyncio.run(collect(manager))
+
+    assert [stage for stage, _ in stages] == ["lexical", "dense"]
+    assert {doc.page_content for doc, _ in stages[0][1]} == {TEXTS[0], TEXTS[2], TEXTS[3]}
+    # MMR with one result per source leaves one chunk from each of the two files
+    assert len(stages[1][1]) == 2
+
+
+if __name__ == "__main__":
+    run_checks(globals())
@@ -0,0 +1,88 @@
+"""
+Diversification checks for AI Research Assistant
+Exercises MMR selection order, the per-source cap, and MMR searches on
+FAISS and ChromaDB stores with a stand-in engine.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.utils
+from app.mmr import mmr_select
+from app.utils import VectorStoreManager
+from experiments.offline import StandInEngine, hash_vector, patched, run_checks
+
+
+def test_mmr_relevance_only_keeps_similarity_order():
+    """With lambda_mult=1 the selection is the candidates sorted by similarity."""
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal(8)
+    candidates = rng.standard_normal((20, 8))
+
+    similarity = candidates @ query / np.linalg.norm(candidates, axis=1)
+    expected = list(np.argsort(-similarity)[:6])
+    assert mmr_select(query, candidates, 6, lambda_mult=1.0) == expected
+
+
+def test_mmr_skips_near_duplicates():
+    """A duplicate of the best candidate loses to a less similar but novel one."""
+    query = np.array([1.0, 0.0, 0.0])
+    candidates = np.array([
+        [1.0, 0.1, 0.0],
+        [1.0, 0.1, 0.0],  # duplicate of the best match
+        [0.7, 0.0, 0.7]
+    ])
+    assert mmr_select(query, candidates, 2, lambda_mult=0.5) == [0, 2]
+    assert mmr_select(query, candidates, 2, lambda_mult=1.0) == [0, 1]
+
+
+def test_mmr_caps_results_per_source():
+    """No source contributes more than max_per_source results, even if fewer than k remain."""
+    rng = np.random.default_rng(1)
+    candidates = rng.standard_normal((12, 8))
+    sources = np.repeat(np.arange(3), 4)
+
+    selected = mmr_select(rng.standard_normal(8), candidates, 10, sources=sources, max_per_source=2)
+    assert len(selected) == 6
+    assert np.bincount(sources[selected], minlength=3).tolist() == [2, 2, 2]
+    assert len(set(selected)) == len(selected)
+
+
+def _documents():
+    """Chunks of four files, several nearly identical per file."""
+    return [
+        Document(page_content=f"shared passage {i % 2} of file {f}", metadata={'source': f"file{f}.txt"})
+        for f in range(4) for i in range(5)
+    ]
+
+
+def test_mmr_search_on_both_stores():
+    """MMR searches respect the per-source cap and return the store's raw distances."""
+    query = "shared passage 0 of file 2"
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        for store_type in ("FAISS", "ChromaDB"):
+            manager = VectorStoreManager(store_type, StandInEngine())
+            manager.create_vector_store(_documents(), "docs")
+
+            plain = manager.similarity_search(query, k=4)
+            diverse = manager.similarity_search(query, k=4, mmr=True, fetch_k=20, max_per_source=1)
+            sources = [doc.metadata['source'] for doc, _ in diverse]
+            assert len(diverse) == 4 and len(set(sources)) == 4, store_type
+
+            # Scores are squared L2 distances to the query vector, as in plain search
+            query_vector = hash_vector(query)
+            for doc, score in diverse + plain:
+                expected = float(np.sum((hash_vector(doc.page_content) - query_vector) ** 2))
+                assert abs(score - expected) < 1e-4, (store_type, score, expected)
+            manager.close()
+
+
+if __name__ == "__main__":
+    run_checks(globals())
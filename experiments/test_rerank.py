@@ -0,0 +1,85 @@
+"""
+Reranker checks for AI Research Assistant
+Exercises batching, caching and candidate pool sizing of the reranker with
+a stand-in scorer, so no cross-encoder is downloaded.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.rerank import Reranker
+from experiments.offline import run_checks
+
+
+class StandInScorer:
+    """Pair scorer that counts query-word overlap and records every call."""
+
+    def __init__(self, seconds_per_pair: float = 0.0):
+        self.seconds_per_pair = seconds_per_pair
+        self.calls = []
+
+    def __call__(self, pairs):
+        self.calls.append(list(pairs))
+        time.sleep(self.seconds_per_pair * len(pairs))
+        return [len(set(query.split()) & set(passage.split())) for query, passage in pairs]
+
+
+def _candidates(texts):
+    """First-stage (Document, distance) tuples for some passages."""
+    return [(Document(page_content=text, metadata={'source': f"doc{i}.txt"}), float(i))
+            for i, text in enumerate(texts)]
+
+
+def test_reranker_orders_by_score():
+    """Candidates are scored in one batch and returned best first."""
+    scorer = StandInScorer()
+    reranker = Reranker(scorer=scorer)
+    candidates = _candidates(["cats", "neural networks learn", "neural nets", "networks learn weights"])
+
+    results = reranker.rerank("how neural networks learn", candidates, k=2)
+
+    assert len(scorer.calls) == 1 and len(scorer.calls[0]) == 4
+    assert [doc.page_content for doc, _ in results] == ["neural networks learn", "networks learn weights"]
+    assert [score for _, score in results] == [3.0, 2.0]
+
+
+def test_reranker_cache():
+    """Repeated pairs are served from the cache; only new candidates are scored."""
+    scorer = StandInScorer()
+    reranker = Reranker(scorer=scorer, cache_size=3)
+    candidates = _candidates(["a b", "b c", "c d"])
+
+    first = reranker.rerank("b c", candidates, k=3)
+    assert reranker.rerank("b c", candidates, k=3) == first
+    assert len(scorer.calls) == 1
+
+    reranker.rerank("b c", _candidates(["a b", "b c", "c d", "b"]), k=3)
+    assert len(scorer.calls) == 2 and [passage for _, passage in scorer.calls[1]] == ["b"]
+
+    # The cache holds three pairs, so the oldest was evicted
+    reranker.rerank("b c", candidates[:1], k=1)
+    assert len(scorer.calls) == 3
+
+    reranker.clear_cache()
+    reranker.rerank("b c", candidates[1:2], k=1)
+    assert len(scorer.calls) == 4
+
+
+def test_reranker_pool_shrinks():
+    """A scorer slower than the latency budget shrinks the candidate pool, but never below k."""
+    reranker = Reranker(scorer=StandInScorer(seconds_per_pair=0.005), candidate_pool=50, latency_budget_ms=50)
+    assert reranker.pool_size(5) == 50
+
+    reranker.rerank("query", _candidates([f"passage {i}" for i in range(20)]), k=5)
+    assert 5 <= reranker.pool_size(5) < 50
+    assert reranker.pool_size(40) == 40
+
+
+if __name__ == "__main__":
+    run_checks(globals())
@@ -0,0 +1,96 @@
+"""
+Snapshot checks for AI Research Assistant
+Exercises versioned publishing, hot reload and the refusal of snapshots
+built with another embedding model, with a stand-in engine.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+
+from chromadb.api.client import SharedSystemClient
+from langchain_core.documents import Document
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import app.utils
+from app.config import INDEX_VERSIONS_KEPT
+from app.utils import VectorStoreManager
+from experiments.offline import StandInEngine, patched, run_checks
+
+
+def _documents(topic: str, count: int = 12):
+    return [Document(page_content=f"{topic} passage {i}", metadata={'source': f"{topic}{i % 3}.txt"}) for i in range(count)]
+
+
+def _build(store_type: str, topic: str, name: str = "docs", model_key: str = "stand-in") -> VectorStoreManager:
+    manager = VectorStoreManager(store_type, StandInEngine(model_key))
+    manager.create_vector_store(_documents(topic), name)
+    return manager
+
+
+def test_publish_and_prune():
+    """Each save publishes the next version, points CURRENT at it and keeps the newest few."""
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        manager = _build("FAISS", "alpha")
+        versions = [manager.save_vector_store("docs") for _ in range(INDEX_VERSIONS_KEPT + 2)]
+
+        assert versions == [f"v{i:06d}" for i in range(1, INDEX_VERSIONS_KEPT + 3)]
+        assert manager.current_version("docs") == versions[-1] == manager.version
+        kept = sorted(path.name for path in (Path(tmp) / "docs_faiss" / "versions").iterdir())
+        assert kept == versions[-INDEX_VERSIONS_KEPT:]
+
+
+def test_reload_swaps_in_new_snapshot():
+    """A loaded index picks up a newer published snapshot and ignores an unchanged pointer."""
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        _build("FAISS", "alpha").save_vector_store("docs")
+        reader = VectorStoreManager("FAISS", StandInEngine())
+        assert reader.load_vector_store("docs") and reader.version == "v000001"
+        assert not reader.reload()
+
+        _build("FAISS", "beta").save_vector_store("docs")
+        assert reader.reload() and reader.version == "v000002"
+        results = reader.similarity_search("beta passage 4", k=3)
+        assert all(doc.page_content.startswith("beta") for doc, _ in results)
+
+
+def test_snapshot_from_another_model_is_refused():
+    """Loading or reloading a snapshot built with a different model fails and keeps the live index."""
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        _build("FAISS", "alpha").save_vector_store("docs")
+        assert not VectorStoreManager("FAISS", StandInEngine("other-model")).load_vector_store("docs")
+
+        reader = VectorStoreManager("FAISS", StandInEngine())
+        assert reader.load_vector_store("docs")
+        _build("FAISS", "beta", model_key="other-model").save_vector_store("docs")
+        try:
+            reader.reload()
+            raise AssertionError("snapshot from another model was swapped in")
+        except ValueError:
+            pass
+        assert reader.version == "v000001"
+        assert reader.similarity_search("alpha passage 1", k=1)[0][0].page_content.startswith("alpha")
+
+
+def test_chroma_snapshots():
+    """An unsaved ChromaDB build is not loadable, and saving leaves only snapshots and their clients."""
+    with tempfile.TemporaryDirectory() as tmp, patched(app.utils, VECTOR_STORE_DIR=Path(tmp)):
+        manager = _build("ChromaDB", "alpha")
+        assert not VectorStoreManager("ChromaDB", StandInEngine()).load_vector_store("docs")
+
+        manager.save_vector_store("docs")
+        manager.save_vector_store("docs")
+        index_dir = Path(tmp) / "docs_chromadb"
+        assert sorted(path.name for path in index_dir.iterdir()) == ["CURRENT", "versions"]
+        cached = [identifier for identifier in SharedSystemClient._identifier_to_system if identifier.startswith(tmp)]
+        assert cached == [str(index_dir / "versions" / "v000002")], cached
+
+        results = manager.similarity_search("alpha passage 2", k=3)
+        assert len(results) == 3
+        manager.close()
+
+
+if __name__ == "__main__":
+    run_checks(globals())